@@ -0,0 +1,10 @@
+"""
+pytest configuration for LumiSync
+Makes the project importable for every test worker
+"""
+
+import os
+import sys
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
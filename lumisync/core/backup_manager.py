@@ -11,10 +11,12 @@ from typing import Dict, List, Optional, Callable, Any
 import logging
 
 from .profile_detector import ApplicationProfileDetector, ProfileInfo
+from .files_cache import FilesCache
+from .cloud_providers.base_provider import CloudProviderError
 from .cloud_providers.provider_factory import create_cloud_provider
 from ..utils.system_utils import GnomeSettingsManager
 from ..utils.file_utils import ArchiveManager, FileManager
-from ..config.settings import TEMP_DIR, BACKUP_FOLDER_STRUCTURE
+from ..config.settings import TEMP_DIR, CACHE_DIR, BACKUP_FOLDER_STRUCTURE
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,7 @@ class BackupManager:
         self.gnome_manager = GnomeSettingsManager()
         self.archive_manager = ArchiveManager()
         self.file_manager = FileManager()
+        self.files_cache_path = CACHE_DIR / f"files_{cloud_provider_type}.db"
         
         # Create working directories
         self.temp_backup_dir = TEMP_DIR / f"backup_{int(time.time())}"
@@ -75,6 +78,8 @@ class BackupManager:
                 progress_callback(current_step, total_steps, message)
             self.logger.info(f"Backup step {current_step}/{total_steps}: {message}")
         
+        files_cache = FilesCache(self.files_cache_path)
+        
         try:
             update_progress("Initializing backup process")
             
@@ -104,6 +109,7 @@ class BackupManager:
             # Step 4: Create application profile archives
             update_progress("Creating application profile archives")
             profile_archives = {}
+            remote_files = self._list_remote_file_names()
             
             for app_name, profiles in detected_profiles.items():
                 if profiles:  # Take the first (preferred) profile
@@ -111,6 +117,17 @@ class BackupManager:
                     if self.profile_detector.validate_profile(profile):
                         archive_path = self.temp_backup_dir / f"{app_name}_profile.tar.gz"
                         
+                        # Scan before archiving: a file edited while the archive
+                        # is written then looks changed on the next run
+                        signatures = files_cache.scan(profile.profile_path)
+                        
+                        # The archive from the last backup is still in the cloud
+                        # and nothing in the profile changed since, so reuse it
+                        if (archive_path.name in remote_files
+                                and files_cache.tree_unchanged(profile.profile_path, signatures)):
+                            self.logger.info(f"Profile for {app_name} unchanged, skipping archive")
+                            continue
+                        
                         if self.archive_manager.create_tar_archive(
                             source_path=profile.profile_path,
                             archive_path=archive_path,
@@ -118,7 +135,9 @@ class BackupManager:
                         ):
                             profile_archives[app_name] = {
                                 'archive_path': str(archive_path),
-                                'profile_info': profile.to_dict()
+                                'profile_info': profile.to_dict(),
+                                'profile_path': profile.profile_path,
+                                'signatures': signatures
                             }
                             backup_info['files_created'].append(str(archive_path))
                             self.logger.info(f"Created archive for {app_name}: {archive_path}")
@@ -148,6 +167,9 @@ class BackupManager:
             cloud_files = self._upload_backup_to_cloud()
             backup_info['cloud_files'] = cloud_files
             
+            for archive in profile_archives.values():
+                files_cache.record_tree(archive['profile_path'], archive['signatures'])
+            
             backup_info['status'] = 'completed'
             self.logger.info("Backup completed successfully")
             
@@ -158,6 +180,7 @@ class BackupManager:
             raise BackupError(f"Backup process failed: {e}")
         
         finally:
+            files_cache.close()
             # Cleanup temporary files
             self._cleanup_temp_files()
         
@@ -227,30 +250,31 @@ class BackupManager:
             self.logger.error(f"Error creating packages list: {e}")
             return False
     
+    def _list_remote_file_names(self) -> set:
+        """Return the names of the files currently in the LumiSync cloud folder."""
+        try:
+            return {file['name'] for file in self.cloud_provider.list_lumisync_files()}
+        except CloudProviderError as e:
+            self.logger.warning(f"Could not list cloud files, archiving all profiles: {e}")
+            return set()
+    
     def _upload_backup_to_cloud(self) -> Dict[str, str]:
         """Upload backup files to cloud storage."""
-        cloud_files = {}
-        
         try:
-            # Get or create LumiSync folder
-            lumisync_folder_id = self.cloud_provider.get_lumisync_folder_id()
+            # Profiles are already bundled into one archive per application, so
+            # this is a handful of files; hand them to the provider together so
+            # it can overlap the uploads where its client allows
+            backup_data = {
+                file_path.name: file_path
+                for file_path in self.temp_backup_dir.iterdir()
+                if file_path.is_file()
+            }
+            cloud_files = self.cloud_provider.upload_backup_structure(backup_data)
             
-            # Upload all files in temp backup directory
-            for file_path in self.temp_backup_dir.iterdir():
-                if file_path.is_file():
-                    self.logger.info(f"Uploading {file_path.name}")
-                    
-                    file_id = self.cloud_provider.upload_file(
-                        local_path=file_path,
-                        remote_path=file_path.name,
-                        parent_id=lumisync_folder_id
-                    )
-                    
-                    if file_id:
-                        cloud_files[file_path.name] = file_id
-                        self.logger.info(f"Uploaded {file_path.name} with ID: {file_id}")
-                    else:
-                        raise BackupError(f"Failed to upload {file_path.name}")
+            for name, file_id in cloud_files.items():
+                if not file_id:
+                    raise BackupError(f"Failed to upload {name}")
+                self.logger.info(f"Uploaded {name} with ID: {file_id}")
             
             return cloud_files
             
@@ -4,6 +4,7 @@ Defines the interface that all cloud storage providers must implement
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 import logging
@@ -39,6 +40,10 @@ class CloudProvider(ABC):
     (Google Drive, OneDrive, Box, pCloud) must implement to work with LumiSync.
     """
     
+    # Number of uploads upload_backup_structure keeps in flight; providers
+    # whose client is safe to share between threads can raise this
+    max_concurrent_uploads = 1
+    
     def __init__(self, provider_name: str):
         """
         Initialize the cloud provider.
@@ -211,6 +216,19 @@ class CloudProvider(ABC):
             folder_id = self.create_folder("LumiSync")
         return folder_id
     
+    def list_lumisync_files(self) -> List[Dict[str, Any]]:
+        """
+        List the files in the LumiSync folder.
+        
+        Returns:
+            List of file information dictionaries, empty if the folder
+            does not exist yet
+        """
+        folder_id = self.find_folder("LumiSync")
+        if not folder_id:
+            return []
+        return self.list_files(folder_id=folder_id)
+    
     def upload_backup_structure(self, backup_data: Dict[str, Path], 
                               progress_callback: Optional[callable] = None) -> Dict[str, str]:
         """
@@ -226,23 +244,42 @@ class CloudProvider(ABC):
         lumisync_folder_id = self.get_lumisync_folder_id()
         uploaded_files = {}
         
-        total_files = len(backup_data)
-        for i, (remote_path, local_path) in enumerate(backup_data.items()):
-            self.logger.info(f"Uploading {remote_path} ({i+1}/{total_files})")
-            
+        def upload(remote_path: str, local_path: Path) -> str:
             try:
-                file_id = self.upload_file(
+                return self.upload_file(
                     local_path=local_path,
                     remote_path=remote_path,
                     parent_id=lumisync_folder_id,
                     progress_callback=progress_callback
                 )
-                uploaded_files[remote_path] = file_id
-                
             except Exception as e:
                 self.logger.error(f"Failed to upload {remote_path}: {e}")
                 raise UploadError(f"Failed to upload {remote_path}: {e}")
         
+        total_files = len(backup_data)
+        if self.max_concurrent_uploads <= 1:
+            for i, (remote_path, local_path) in enumerate(backup_data.items()):
+                self.logger.info(f"Uploading {remote_path} ({i+1}/{total_files})")
+                uploaded_files[remote_path] = upload(remote_path, local_path)
+            return uploaded_files
+        
+        # Per-request latency dominates many small files, so keep a bounded
+        # number of uploads running at once
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_uploads) as executor:
+            futures = {
+                executor.submit(upload, remote_path, local_path): remote_path
+                for remote_path, local_path in backup_data.items()
+            }
+            for i, future in enumerate(as_completed(futures)):
+                remote_path = futures[future]
+                try:
+                    uploaded_files[remote_path] = future.result()
+                except UploadError:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                self.logger.info(f"Uploaded {remote_path} ({i+1}/{total_files})")
+        
         return uploaded_files
     
     def download_backup_structure(self, file_mapping: Dict[str, str], 
@@ -25,6 +25,9 @@ class PCloudProvider(CloudProvider):
     for pCloud using the pCloud API.
     """
     
+    # Each API call is an independent HTTP request carrying the auth token
+    max_concurrent_uploads = 4
+    
     def __init__(self):
         super().__init__("pCloud")
         self.api_base = "https://api.pcloud.com"
@@ -148,13 +151,15 @@ class PCloudProvider(CloudProvider):
         }
     
     def upload_file(self, local_path: Path, remote_path: str, 
+                   parent_id: Optional[str] = None, 
                    progress_callback: Optional[callable] = None) -> str:
         """
         Upload a file to pCloud.
         
         Args:
             local_path: Local file path
-            remote_path: Remote file path (relative to Lumi-Sync folder)
+            remote_path: Remote file path (relative to parent_id)
+            parent_id: ID of the parent folder (None for the Lumi-Sync folder)
             progress_callback: Optional callback for progress updates
             
         Returns:
@@ -171,7 +176,7 @@ class PCloudProvider(CloudProvider):
         
         try:
             # Use Lumi-Sync folder as base
-            folder_id = self.lumisync_folder_id or 0
+            folder_id = int(parent_id) if parent_id else (self.lumisync_folder_id or 0)
             
             # Create subdirectories if needed
             if '/' in remote_path:
@@ -328,6 +333,27 @@ class PCloudProvider(CloudProvider):
             logger.error(f"pCloud list files error: {str(e)}")
             raise CloudProviderError(f"Failed to list files: {str(e)}")
     
+    def get_lumisync_folder_id(self) -> Optional[str]:
+        """
+        Get the ID of the Lumi-Sync folder set up during authentication.
+        
+        Returns:
+            ID of the Lumi-Sync folder, None if it could not be created
+        """
+        return str(self.lumisync_folder_id) if self.lumisync_folder_id else None
+    
+    def list_lumisync_files(self) -> List[Dict[str, Any]]:
+        """
+        List the files in the Lumi-Sync folder.
+        
+        Returns:
+            List of file information dictionaries, empty if the folder
+            does not exist yet
+        """
+        if not self.lumisync_folder_id:
+            return []
+        return self.list_files()
+    
     def delete_file(self, remote_path: str) -> bool:
         """
         Delete a file from pCloud.
@@ -445,36 +471,17 @@ class PCloudProvider(CloudProvider):
             if not part:
                 continue
             
-            # Check if folder exists
-            response = requests.get(f"{self.api_base}/listfolder", params={
+            # Idempotent, so concurrent uploads into the same folder don't race
+            response = requests.get(f"{self.api_base}/createfolderifnotexists", params={
                 'auth': self.auth_token,
                 'folderid': current_id,
-                'nofiles': 1
+                'name': part
             })
             
-            folder_exists = False
             if response.status_code == 200:
                 data = response.json()
                 if data.get('result') == 0:
-                    folders = data.get('metadata', {}).get('contents', [])
-                    for folder in folders:
-                        if folder.get('name') == part and folder.get('isfolder'):
-                            current_id = folder.get('folderid')
-                            folder_exists = True
-                            break
-            
-            if not folder_exists:
-                # Create folder
-                response = requests.get(f"{self.api_base}/createfolder", params={
-                    'auth': self.auth_token,
-                    'folderid': current_id,
-                    'name': part
-                })
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('result') == 0:
-                        current_id = data.get('metadata', {}).get('folderid')
+                    current_id = data.get('metadata', {}).get('folderid')
         
         return current_id
     
@@ -3,12 +3,11 @@ Cloud Provider Factory
 Creates and manages cloud provider instances
 """
 
-from typing import Dict, Type, Optional
+import importlib
+from typing import Dict, Type, Optional, Union
 import logging
 
 from .base_provider import CloudProvider
-from .google_drive import GoogleDriveProvider
-from .pcloud import PCloudProvider
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +21,12 @@ class CloudProviderFactory:
     in the future.
     """
     
-    # Registry of available providers
-    _providers: Dict[str, Type[CloudProvider]] = {
-        'google_drive': GoogleDriveProvider,
-        'pcloud': PCloudProvider,
+    # Registry of available providers. Built-in providers are given as
+    # "module.Class" and imported on first use, so their API client
+    # libraries stay off the application startup path.
+    _providers: Dict[str, Union[str, Type[CloudProvider]]] = {
+        'google_drive': '.google_drive.GoogleDriveProvider',
+        'pcloud': '.pcloud.PCloudProvider',
         # Future providers will be added here:
         # 'onedrive': OneDriveProvider,
         # 'box': BoxProvider,
@@ -40,9 +41,9 @@ class CloudProviderFactory:
             Dictionary mapping provider keys to human-readable names
         """
         provider_names = {}
-        for key, provider_class in cls._providers.items():
+        for key in list(cls._providers):
             # Create a temporary instance to get the display name
-            temp_instance = provider_class()
+            temp_instance = cls._get_provider_class(key)()
             provider_names[key] = temp_instance.provider_name
         
         return provider_names
@@ -65,12 +66,23 @@ class CloudProviderFactory:
             available = list(cls._providers.keys())
             raise ValueError(f"Unsupported provider type '{provider_type}'. Available: {available}")
         
-        provider_class = cls._providers[provider_type]
+        provider_class = cls._get_provider_class(provider_type)
         instance = provider_class()
         
         logger.info(f"Created {instance.provider_name} provider instance")
         return instance
     
+    @classmethod
+    def _get_provider_class(cls, provider_type: str) -> Type[CloudProvider]:
+        """Get a registered provider class, importing it on first use."""
+        provider_class = cls._providers[provider_type]
+        if isinstance(provider_class, str):
+            module_name, class_name = provider_class.rsplit('.', 1)
+            module = importlib.import_module(module_name, __package__)
+            provider_class = getattr(module, class_name)
+            cls._providers[provider_type] = provider_class
+        return provider_class
+    
     @classmethod
     def register_provider(cls, provider_key: str, provider_class: Type[CloudProvider]):
         """
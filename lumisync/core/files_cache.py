@@ -0,0 +1,116 @@
+"""
+Local File Metadata Cache
+Remembers (mtime, size, inode) of backed-up files so unchanged profiles can be skipped
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Tuple
+import logging
+
+from ..utils.file_utils import exclude_matcher
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[int, int, int]  # (mtime_ns, size, inode)
+
+
+class FilesCache:
+    """
+    Persistent SQLite cache of file signatures from the last successful backup.
+
+    A file counts as unchanged when its mtime, size and inode all match the
+    stored row, the same check borg and restic use to avoid re-reading data.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, inode INTEGER)"
+        )
+        self._conn.commit()
+
+    def scan(self, root: Path) -> Dict[str, Signature]:
+        """
+        Collect the signature of every file below root that gets archived.
+
+        Uses the same exclude patterns as ArchiveManager, so caches and lock
+        files left out of the archive do not make a profile look changed.
+
+        Args:
+            root: Directory to scan
+
+        Returns:
+            Dictionary mapping file paths to their signatures
+        """
+        excluded = exclude_matcher()
+        signatures = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not excluded(d)]
+            for filename in filenames:
+                if excluded(filename):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path, follow_symlinks=False)
+                except OSError:
+                    continue
+                signatures[path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return signatures
+
+    def tree_unchanged(self, root: Path, signatures: Dict[str, Signature]) -> bool:
+        """
+        Check whether no file below root changed since it was last recorded.
+
+        Args:
+            root: Directory to check
+            signatures: Current signatures of root, as returned by scan()
+
+        Returns:
+            True if every file matches its cached signature and none were
+            added or removed, False otherwise
+        """
+        prefix = os.path.join(str(root), "")
+        cached = {
+            path: (mtime, size, inode)
+            for path, mtime, size, inode in self._conn.execute(
+                "SELECT path, mtime, size, inode FROM files WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix)
+            )
+        }
+        return bool(cached) and cached == signatures
+
+    def record_tree(self, root: Path, signatures: Dict[str, Signature]):
+        """
+        Replace the stored signatures of root with the given ones.
+
+        Pass the signatures scanned before archiving, not a fresh scan, so a
+        file edited after it was archived is not recorded as backed up.
+
+        Args:
+            root: Directory that was backed up successfully
+            signatures: Signatures scanned when root was archived
+        """
+        prefix = os.path.join(str(root), "")
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+            )
+            self._conn.executemany(
+                "INSERT INTO files (path, mtime, size, inode) VALUES (?, ?, ?, ?)",
+                ((path, *signature) for path, signature in signatures.items())
+            )
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class ProfileInfo:
     """Container for application profile information."""
     
+    __slots__ = ('app_name', 'install_type', 'profile_path', 'profile_name', 'is_active', 'size_mb')
+    
     def __init__(self, app_name: str, install_type: str, profile_path: Path, 
                  profile_name: str = "default", is_active: bool = True):
         self.app_name = app_name
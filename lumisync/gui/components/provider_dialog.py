@@ -13,6 +13,13 @@ from PyQt6.QtGui import QFont
 from ..themes.lumi_setup_theme import LUMI_COLORS
 from ...core.cloud_providers.provider_factory import CloudProviderFactory
 
+# Status label color per authentication state, formatted once at import
+_STATUS_LABEL_QSS = {
+    'connecting': f"color: {LUMI_COLORS['text_secondary']};",
+    'success': f"color: {LUMI_COLORS['accent_green']};",
+    'failed': f"color: {LUMI_COLORS['accent_red']};",
+}
+
 
 class AuthenticationThread(QThread):
     """Background thread for cloud provider authentication"""
@@ -113,6 +120,12 @@ class ProviderSelectionDialog(QDialog):
         # Initialize with first provider
         self._on_provider_changed()
         
+    def reset(self):
+        """Clear the result of a previous connection attempt"""
+        self.connect_btn.setEnabled(True)
+        self.progress_bar.hide()
+        self.status_label.setText("")
+        
     def _setup_styles(self):
         self.setStyleSheet(f"""
             QDialog {{
@@ -266,7 +279,7 @@ class ProviderSelectionDialog(QDialog):
         self.connect_btn.setEnabled(False)
         self.progress_bar.show()
         self.status_label.setText("Connecting...")
-        self.status_label.setStyleSheet(f"color: {LUMI_COLORS['text_secondary']};")
+        self.status_label.setStyleSheet(_STATUS_LABEL_QSS['connecting'])
         
         self.auth_thread = AuthenticationThread(provider_type, credentials)
         self.auth_thread.auth_success.connect(self._on_auth_success)
@@ -277,7 +290,7 @@ class ProviderSelectionDialog(QDialog):
         """Handle successful authentication"""
         self.progress_bar.hide()
         self.status_label.setText(f"Successfully connected to {email}")
-        self.status_label.setStyleSheet(f"color: {LUMI_COLORS['accent_green']};")
+        self.status_label.setStyleSheet(_STATUS_LABEL_QSS['success'])
         
         # Emit signal and close dialog
         self.provider_connected.emit(email, provider_type, provider_instance)
@@ -288,7 +301,7 @@ class ProviderSelectionDialog(QDialog):
         self.connect_btn.setEnabled(True)
         self.progress_bar.hide()
         self.status_label.setText(f"Connection failed: {error}")
-        self.status_label.setStyleSheet(f"color: {LUMI_COLORS['accent_red']};")
+        self.status_label.setStyleSheet(_STATUS_LABEL_QSS['failed'])
         
         QMessageBox.critical(self, "Connection Failed", 
                            f"Failed to connect to cloud storage:\n\n{error}")
@@ -4,10 +4,11 @@ Progress, Logs, and Settings tabs
 """
 
 import datetime
+from collections import deque
 from typing import Dict, Any, List
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFrame, QProgressBar, QGroupBox, QGridLayout, QTextEdit,
+    QFrame, QProgressBar, QGroupBox, QGridLayout, QPlainTextEdit,
     QComboBox, QFileDialog, QCheckBox, QSpinBox, QLineEdit,
     QTableWidget, QTableWidgetItem, QHeaderView
 )
@@ -250,9 +251,26 @@ class ProgressTabWidget(QWidget):
 class LogsTabWidget(QWidget):
     """Logs tab with filtering and export capabilities"""
     
+    MAX_ENTRIES = 10000
+    
+    _LEVEL_COLORS = {
+        'INFO': LUMI_COLORS['info'],
+        'WARNING': LUMI_COLORS['warning'],
+        'ERROR': LUMI_COLORS['error'],
+        'DEBUG': LUMI_COLORS['text_secondary']
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.log_entries = []
+        self.log_entries = deque(maxlen=self.MAX_ENTRIES)
+        self._pending_entries = []
+        
+        # New entries are appended to the display in batches, at most every 50 ms
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
         self._setup_ui()
         
     def _setup_ui(self):
@@ -310,10 +328,13 @@ class LogsTabWidget(QWidget):
         filter_layout.addWidget(self.export_btn)
         
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        # One block per entry, so the document drops its oldest lines in
+        # step with log_entries
+        self.log_display.setMaximumBlockCount(self.MAX_ENTRIES)
         self.log_display.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {LUMI_COLORS['bg_secondary']};
                 color: {LUMI_COLORS['text_primary']};
                 border: 1px solid {LUMI_COLORS['border']};
@@ -338,35 +359,51 @@ class LogsTabWidget(QWidget):
             'message': message
         }
         self.log_entries.append(entry)
-        self._update_display()
+        self._pending_entries.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
         
-    def _update_display(self):
-        """Update the log display based on current filter"""
+    def _format_entries(self, entries) -> str:
+        """Render the entries matching the current filter as HTML, one paragraph each"""
         filter_level = self.filter_combo.currentText()
         
-        display_text = ""
-        for entry in self.log_entries:
+        parts = []
+        for entry in entries:
             if filter_level == "All" or entry['level'] == filter_level.upper():
                 timestamp_str = entry['timestamp'].strftime("%H:%M:%S")
                 level_color = self._get_level_color(entry['level'])
-                display_text += f"<span style='color: {LUMI_COLORS['text_secondary']}'>[{timestamp_str}]</span> "
-                display_text += f"<span style='color: {level_color}'>{entry['level']}</span>: "
-                display_text += f"<span style='color: {LUMI_COLORS['text_primary']}'>{entry['message']}</span><br>"
-                
-        self.log_display.setHtml(display_text)
-        # Scroll to bottom
+                parts.append(
+                    f"<p><span style='color: {LUMI_COLORS['text_secondary']}'>[{timestamp_str}]</span> "
+                    f"<span style='color: {level_color}'>{entry['level']}</span>: "
+                    f"<span style='color: {LUMI_COLORS['text_primary']}'>{entry['message']}</span></p>"
+                )
+        return "".join(parts)
+        
+    def _scroll_to_bottom(self):
         scrollbar = self.log_display.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         
+    def _flush_pending(self):
+        """Append the entries added since the last flush in one insert"""
+        html = self._format_entries(self._pending_entries)
+        self._pending_entries.clear()
+        if html:
+            self.log_display.appendHtml(html)
+            self._scroll_to_bottom()
+        
+    def _update_display(self):
+        """Update the log display based on current filter"""
+        self._flush_timer.stop()
+        self._pending_entries.clear()
+        self.log_display.clear()
+        html = self._format_entries(self.log_entries)
+        if html:
+            self.log_display.appendHtml(html)
+        self._scroll_to_bottom()
+        
     def _get_level_color(self, level: str) -> str:
         """Get color for log level"""
-        colors = {
-            'INFO': LUMI_COLORS['info'],
-            'WARNING': LUMI_COLORS['warning'],
-            'ERROR': LUMI_COLORS['error'],
-            'DEBUG': LUMI_COLORS['text_secondary']
-        }
-        return colors.get(level, LUMI_COLORS['text_primary'])
+        return self._LEVEL_COLORS.get(level, LUMI_COLORS['text_primary'])
         
     def _apply_filter(self):
         """Apply the selected filter"""
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     from PyQt6.QtWidgets import (
@@ -23,7 +24,7 @@ try:
     )
     from PyQt6.QtCore import (
         Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation,
-        QEasingCurve, QRect, QSize, QPoint, QSettings
+        QEasingCurve, QRect, QSize, QPoint, QSettings, QMutex, QWaitCondition
     )
     from PyQt6.QtGui import (
         QFont, QIcon, QPalette, QColor, QPixmap, QPainter,
@@ -89,9 +90,7 @@ class ModernProgressBar(QProgressBar):
             QProgressBar {{
                 border: 2px solid {COLORS['border']};
                 border-radius: 8px;
-                background-color: {COLORS['bg_secondary']};
                 text-align: center;
-                color: {COLORS['text_primary']};
                 font-weight: bold;
                 font-size: 11px;
                 min-height: 20px;
@@ -105,6 +104,94 @@ class ModernProgressBar(QProgressBar):
         """)
 
 
+@lru_cache(maxsize=8)
+def _button_qss(button_type: str) -> str:
+    """Build (once per type) the stylesheet for a ModernButton."""
+    styles = {
+        'primary': f"""
+            QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {COLORS['accent_blue']}, stop:1 #74c0fc);
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #74c0fc, stop:1 {COLORS['accent_blue']});
+            }}
+            QPushButton:pressed {{
+                background: {COLORS['accent_blue']};
+            }}
+            QPushButton:disabled {{
+                background: {COLORS['bg_tertiary']};
+                color: {COLORS['text_muted']};
+            }}
+        """,
+        'success': f"""
+            QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {COLORS['accent_green']}, stop:1 #94d82d);
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #94d82d, stop:1 {COLORS['accent_green']});
+            }}
+        """,
+        'warning': f"""
+            QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {COLORS['accent_orange']}, stop:1 #fd7e14);
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #fd7e14, stop:1 {COLORS['accent_orange']});
+            }}
+        """,
+        'danger': f"""
+            QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {COLORS['accent_red']}, stop:1 #e03131);
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #e03131, stop:1 {COLORS['accent_red']});
+            }}
+        """,
+        'secondary': f"""
+            QPushButton {{
+                border: 2px solid {COLORS['border']};
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background: {COLORS['bg_tertiary']};
+                border-color: {COLORS['accent_blue']};
+            }}
+        """
+    }
+    
+    return styles.get(button_type, styles['primary'])
+
+
 class ModernButton(QPushButton):
     """Custom button with modern styling and animations."""
     
@@ -117,96 +204,20 @@ class ModernButton(QPushButton):
     
     def _setup_style(self):
         """Setup button styling based on type."""
-        styles = {
-            'primary': f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {COLORS['accent_blue']}, stop:1 #74c0fc);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #74c0fc, stop:1 {COLORS['accent_blue']});
-                }}
-                QPushButton:pressed {{
-                    background: {COLORS['accent_blue']};
-                }}
-                QPushButton:disabled {{
-                    background: {COLORS['bg_tertiary']};
-                    color: {COLORS['text_muted']};
-                }}
-            """,
-            'success': f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {COLORS['accent_green']}, stop:1 #94d82d);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #94d82d, stop:1 {COLORS['accent_green']});
-                }}
-            """,
-            'warning': f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {COLORS['accent_orange']}, stop:1 #fd7e14);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #fd7e14, stop:1 {COLORS['accent_orange']});
-                }}
-            """,
-            'danger': f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {COLORS['accent_red']}, stop:1 #e03131);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #e03131, stop:1 {COLORS['accent_red']});
-                }}
-            """,
-            'secondary': f"""
-                QPushButton {{
-                    background: {COLORS['bg_secondary']};
-                    color: {COLORS['text_primary']};
-                    border: 2px solid {COLORS['border']};
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background: {COLORS['bg_tertiary']};
-                    border-color: {COLORS['accent_blue']};
-                }}
-            """
-        }
-        
-        self.setStyleSheet(styles.get(self.button_type, styles['primary']))
+        self.setStyleSheet(_button_qss(self.button_type))
 
 
 class LogWidget(QTextEdit):
     """Advanced logging widget with filtering and export capabilities."""
     
+    # Color coding for different log levels
+    _LEVEL_COLORS = {
+        'DEBUG': COLORS['text_muted'],
+        'INFO': COLORS['accent_blue'],
+        'WARNING': COLORS['accent_orange'],
+        'ERROR': COLORS['accent_red']
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
@@ -220,12 +231,9 @@ class LogWidget(QTextEdit):
         self.setFont(QFont("Consolas", 9))
         self.setStyleSheet(f"""
             QTextEdit {{
-                background-color: {COLORS['bg_primary']};
-                color: {COLORS['text_primary']};
                 border: 2px solid {COLORS['border']};
                 border-radius: 8px;
                 padding: 8px;
-                selection-background-color: {COLORS['accent_blue']};
             }}
         """)
     
@@ -257,15 +265,7 @@ class LogWidget(QTextEdit):
         level = entry['level']
         message = entry['message']
         
-        # Color coding for different log levels
-        colors = {
-            'DEBUG': COLORS['text_muted'],
-            'INFO': COLORS['accent_blue'],
-            'WARNING': COLORS['accent_orange'],
-            'ERROR': COLORS['accent_red']
-        }
-        
-        color = colors.get(level, COLORS['text_primary'])
+        color = self._LEVEL_COLORS.get(level, COLORS['text_primary'])
         
         formatted_entry = f"""
         <div style="margin: 2px 0; padding: 4px; border-left: 3px solid {color};">
@@ -314,6 +314,8 @@ class BackupThread(QThread):
         self.selected_categories = selected_categories or []
         self.is_paused = False
         self.should_stop = False
+        self._pause_mutex = QMutex()
+        self._pause_cond = QWaitCondition()
     
     def run(self):
         try:
@@ -332,8 +334,11 @@ class BackupThread(QThread):
     
     def _progress_callback(self, current: int, total: int, message: str):
         """Handle progress updates with pause/stop support."""
+        # Block on the wait condition while paused; resume()/stop() wake us up
+        self._pause_mutex.lock()
         while self.is_paused and not self.should_stop:
-            self.msleep(100)
+            self._pause_cond.wait(self._pause_mutex)
+        self._pause_mutex.unlock()
         
         if self.should_stop:
             return False
@@ -348,12 +353,18 @@ class BackupThread(QThread):
     
     def resume(self):
         """Resume the backup process."""
+        self._pause_mutex.lock()
         self.is_paused = False
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         self.status_changed.emit("Backup resumed")
     
     def stop(self):
         """Stop the backup process."""
+        self._pause_mutex.lock()
         self.should_stop = True
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         self.status_changed.emit("Backup stopped")
 
 
@@ -371,6 +382,8 @@ class RestoreThread(QThread):
         self.selected_categories = selected_categories or []
         self.is_paused = False
         self.should_stop = False
+        self._pause_mutex = QMutex()
+        self._pause_cond = QWaitCondition()
     
     def run(self):
         try:
@@ -389,8 +402,11 @@ class RestoreThread(QThread):
     
     def _progress_callback(self, current: int, total: int, message: str):
         """Handle progress updates with pause/stop support."""
+        # Block on the wait condition while paused; resume()/stop() wake us up
+        self._pause_mutex.lock()
         while self.is_paused and not self.should_stop:
-            self.msleep(100)
+            self._pause_cond.wait(self._pause_mutex)
+        self._pause_mutex.unlock()
         
         if self.should_stop:
             return False
@@ -405,15 +421,43 @@ class RestoreThread(QThread):
     
     def resume(self):
         """Resume the restore process."""
+        self._pause_mutex.lock()
         self.is_paused = False
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         self.status_changed.emit("Restore resumed")
     
     def stop(self):
         """Stop the restore process."""
+        self._pause_mutex.lock()
         self.should_stop = True
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         self.status_changed.emit("Restore stopped")
 
 
+def create_palette() -> QPalette:
+    """Build the application-wide dark palette from COLORS."""
+    palette = QPalette()
+    
+    palette.setColor(QPalette.ColorRole.Window, QColor(COLORS['bg_primary']))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(COLORS['text_primary']))
+    palette.setColor(QPalette.ColorRole.Base, QColor(COLORS['bg_primary']))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(COLORS['bg_secondary']))
+    palette.setColor(QPalette.ColorRole.Text, QColor(COLORS['text_primary']))
+    palette.setColor(QPalette.ColorRole.Button, QColor(COLORS['bg_secondary']))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(COLORS['text_primary']))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(COLORS['accent_blue']))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(COLORS['bg_primary']))
+    
+    # Disabled colors
+    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, QColor(COLORS['text_muted']))
+    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(COLORS['text_muted']))
+    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(COLORS['text_muted']))
+    
+    return palette
+
+
 def create_application():
     """Create the QApplication with modern styling."""
     app = QApplication(sys.argv)
@@ -421,6 +465,11 @@ def create_application():
     app.setApplicationVersion("2.0")
     app.setOrganizationName("LumiSync")
     
+    # Base colors live in the application palette so widget stylesheets
+    # only need to carry the rules a palette can't express (gradients, borders)
+    app.setStyle("Fusion")
+    app.setPalette(create_palette())
+    
     # Set application icon if available
     try:
         app.setWindowIcon(QIcon("assets/icon.png"))
@@ -7,26 +7,28 @@ Inspired by Lumi-Setup but optimized for synchronization tasks
 import sys
 import json
 import datetime
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Set
+from typing import Optional, List, Set
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
         QPushButton, QLabel, QTextEdit, QProgressBar, QMessageBox,
-        QStatusBar, QFrame, QTabWidget, QSplitter
+        QStatusBar, QFrame, QTabWidget, QSplitter, QDialog
+    )
+    from PyQt6.QtCore import (
+        Qt, QThread, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot,
+        QTimer, QMargins, QMutex, QWaitCondition
     )
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
     from PyQt6.QtGui import QFont, QIcon
 except ImportError as e:
     raise ImportError(f"PyQt6 not installed: {e}. Run 'pip install PyQt6'")
 
-from ..core.backup_manager import BackupManager
-from ..core.restore_manager import RestoreManager
-from ..core.cloud_providers.provider_factory import create_cloud_provider
 from ..utils.logger import get_logger
 from ..config.settings import GUI_SETTINGS
 from .themes.lumi_setup_theme import LUMI_COLORS, FONTS, get_style
@@ -36,48 +38,243 @@ from .components.provider_dialog import ProviderSelectionDialog
 
 logger = get_logger(__name__)
 
-class ConnectionStatus(Enum):
+class ConnectionStatus(IntEnum):
     """Cloud connection status states"""
-    DISCONNECTED = "disconnected"
-    CONNECTING = "connecting"
-    CONNECTED = "connected"
-    ERROR = "error"
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    ERROR = 3
+
+# Stylesheets for the connection/action widgets, formatted once at import
+# and shared by every instance instead of being rebuilt in each _setup_ui
+_STATUS_FRAME_QSS = f"""
+    QFrame {{
+        background-color: {LUMI_COLORS['bg_secondary']};
+        border: 1px solid {LUMI_COLORS['border']};
+        border-radius: 8px;
+        padding: 10px;
+    }}
+"""
+
+# Status indicator color per connection state, resolved once at import
+_STATUS_COLORS = {
+    ConnectionStatus.DISCONNECTED: LUMI_COLORS['accent_red'],
+    ConnectionStatus.CONNECTING: LUMI_COLORS['accent_orange'],
+    ConnectionStatus.CONNECTED: LUMI_COLORS['accent_green'],
+    ConnectionStatus.ERROR: LUMI_COLORS['accent_red'],
+}
+
+# Every connection state's icon color lives in one sheet; set_status only
+# flips the "state" property instead of re-parsing a new stylesheet
+_STATUS_ICON_QSS = "QLabel#statusIcon { font-size: 16px; }\n" + "".join(
+    f'QLabel#statusIcon[state="{int(status)}"] {{ color: {color}; }}\n'
+    for status, color in _STATUS_COLORS.items()
+)
+
+_STATUS_LABEL_QSS = f"color: {LUMI_COLORS['text_primary']}; font-weight: bold;"
+
+_CONNECT_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {LUMI_COLORS['accent_cyan']};
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        background-color: {LUMI_COLORS['accent_teal']};
+    }}
+    QPushButton:pressed {{
+        background-color: {LUMI_COLORS['bg_tertiary']};
+    }}
+"""
+
+_DISCONNECT_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {LUMI_COLORS['bg_tertiary']};
+        color: {LUMI_COLORS['text_secondary']};
+        border: 1px solid {LUMI_COLORS['border']};
+        border-radius: 4px;
+        font-size: 10px;
+    }}
+    QPushButton:hover {{
+        background-color: {LUMI_COLORS['bg_hover']};
+    }}
+"""
+
+_BACKUP_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {LUMI_COLORS['accent_green']};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 14px;
+    }}
+    QPushButton:hover:enabled {{
+        background-color: {LUMI_COLORS['success']};
+    }}
+    QPushButton:disabled {{
+        background-color: {LUMI_COLORS['bg_tertiary']};
+        color: {LUMI_COLORS['text_muted']};
+    }}
+"""
+
+_RESTORE_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {LUMI_COLORS['bg_tertiary']};
+        color: {LUMI_COLORS['text_primary']};
+        border: 2px solid {LUMI_COLORS['border']};
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 14px;
+    }}
+    QPushButton:hover:enabled {{
+        background-color: {LUMI_COLORS['bg_hover']};
+        border-color: {LUMI_COLORS['accent_cyan']};
+    }}
+    QPushButton:disabled {{
+        background-color: {LUMI_COLORS['bg_tertiary']};
+        color: {LUMI_COLORS['text_muted']};
+        border-color: {LUMI_COLORS['border']};
+    }}
+"""
+
+# Main window container stylesheets; each stays scoped to its own widget so
+# the cascade into child frames is unchanged
+_MAIN_WINDOW_QSS = f"""
+    QMainWindow {{
+        background-color: {LUMI_COLORS['bg_primary']};
+        color: {LUMI_COLORS['text_primary']};
+    }}
+"""
+
+_SPLITTER_QSS = f"""
+    QSplitter::handle {{
+        background-color: {LUMI_COLORS['border']};
+        width: 2px;
+    }}
+    QSplitter::handle:hover {{
+        background-color: {LUMI_COLORS['accent_cyan']};
+    }}
+"""
+
+_LEFT_PANEL_QSS = f"""
+    QFrame {{
+        background-color: {LUMI_COLORS['bg_secondary']};
+        border-right: 1px solid {LUMI_COLORS['border']};
+    }}
+"""
+
+_RIGHT_PANEL_QSS = f"""
+    QFrame {{
+        background-color: {LUMI_COLORS['bg_primary']};
+    }}
+"""
+
+_TOP_SECTION_QSS = f"""
+    QFrame {{
+        background-color: {LUMI_COLORS['bg_primary']};
+        border-bottom: 1px solid {LUMI_COLORS['border']};
+    }}
+"""
+
+_TAB_WIDGET_QSS = f"""
+    QTabWidget::pane {{
+        border: 1px solid {LUMI_COLORS['border']};
+        background-color: {LUMI_COLORS['bg_primary']};
+    }}
+    QTabBar::tab {{
+        background-color: {LUMI_COLORS['bg_secondary']};
+        color: {LUMI_COLORS['text_primary']};
+        border: 1px solid {LUMI_COLORS['border']};
+        border-bottom: none;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }}
+    QTabBar::tab:selected {{
+        background-color: {LUMI_COLORS['bg_primary']};
+        border-bottom: 2px solid {LUMI_COLORS['accent_cyan']};
+    }}
+    QTabBar::tab:hover:!selected {{
+        background-color: {LUMI_COLORS['bg_hover']};
+    }}
+"""
+
+_STATUS_BAR_QSS = f"""
+    QStatusBar {{
+        background-color: {LUMI_COLORS['bg_secondary']};
+        color: {LUMI_COLORS['text_secondary']};
+        border-top: 1px solid {LUMI_COLORS['border']};
+    }}
+"""
+
+# Status bar hint indexed by [has_selection][is_connected]
+_SELECTION_STATUS_MESSAGES = (
+    ("Select items and connect to cloud storage", "Select items to synchronize"),
+    ("Connect to cloud storage to enable backup/restore", "Ready to backup or restore selected items"),
+)
+
+# Shared layout margins, reused instead of passing four ints per call
+_MARGINS_NONE = QMargins(0, 0, 0, 0)
+_MARGINS_OUTER = QMargins(20, 15, 20, 15)
+_MARGINS_ACTIONS = QMargins(20, 10, 20, 10)
+_MARGINS_TOP = QMargins(0, 10, 0, 10)
+
+
+def _apply_layout(layout, margins: QMargins, spacing: int):
+    """Set contents margins and spacing of a layout in one go"""
+    layout.setContentsMargins(margins)
+    layout.setSpacing(spacing)
+
 
 class CloudConnectionWidget(QWidget):
     """Widget for managing cloud connection status and actions"""
     
-    connection_requested = pyqtSignal(str)  # provider type
+    connection_requested = pyqtSignal()  # provider is chosen in the dialog
     disconnection_requested = pyqtSignal()
     
+    # (label text template, show connect button, show disconnect button),
+    # indexed by ConnectionStatus
+    _STATE_TABLE = (
+        ("Status: Not Connected", True, False),  # DISCONNECTED
+        ("Status: Connecting...", False, False),  # CONNECTING
+        ("Connected to: {email}", False, True),  # CONNECTED
+        ("Status: Connection Error", True, False),  # ERROR
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.status = ConnectionStatus.DISCONNECTED
         self.connected_email = ""
         self.provider_type = ""
+        
+        # Bursts of status changes (e.g. during an OAuth handshake) are
+        # coalesced so only the final state is applied to the widgets
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._apply_status)
+        
         self._setup_ui()
         
     def _setup_ui(self):
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 15, 20, 15)
-        layout.setSpacing(10)
+        _apply_layout(layout, _MARGINS_OUTER, 10)
         
         # Status section
         status_frame = QFrame()
-        status_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {LUMI_COLORS['bg_secondary']};
-                border: 1px solid {LUMI_COLORS['border']};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        status_frame.setStyleSheet(_STATUS_FRAME_QSS)
         status_layout = QHBoxLayout(status_frame)
         
         self.status_icon = QLabel("●")
-        self.status_icon.setStyleSheet(f"color: {LUMI_COLORS['accent_red']}; font-size: 16px;")
+        self.status_icon.setObjectName("statusIcon")
+        self.status_icon.setProperty("state", int(self.status))
+        self.status_icon.setStyleSheet(_STATUS_ICON_QSS)
         
         self.status_label = QLabel("Status: Not Connected")
-        self.status_label.setStyleSheet(f"color: {LUMI_COLORS['text_primary']}; font-weight: bold;")
+        self.status_label.setStyleSheet(_STATUS_LABEL_QSS)
         
         status_layout.addWidget(self.status_icon)
         status_layout.addWidget(self.status_label)
@@ -86,84 +283,47 @@ class CloudConnectionWidget(QWidget):
         # Connection button
         self.connect_btn = QPushButton("Connect to Cloud Storage")
         self.connect_btn.setMinimumHeight(40)
-        self.connect_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {LUMI_COLORS['accent_cyan']};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {LUMI_COLORS['accent_teal']};
-            }}
-            QPushButton:pressed {{
-                background-color: {LUMI_COLORS['bg_tertiary']};
-            }}
-        """)
-        self.connect_btn.clicked.connect(self._on_connect_clicked)
+        self.connect_btn.setStyleSheet(_CONNECT_BTN_QSS)
+        self.connect_btn.clicked.connect(self.connection_requested)
         
         # Disconnect button (initially hidden)
         self.disconnect_btn = QPushButton("Disconnect")
         self.disconnect_btn.setMinimumHeight(30)
-        self.disconnect_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {LUMI_COLORS['bg_tertiary']};
-                color: {LUMI_COLORS['text_secondary']};
-                border: 1px solid {LUMI_COLORS['border']};
-                border-radius: 4px;
-                font-size: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {LUMI_COLORS['bg_hover']};
-            }}
-        """)
-        self.disconnect_btn.clicked.connect(self.disconnection_requested.emit)
+        self.disconnect_btn.setStyleSheet(_DISCONNECT_BTN_QSS)
+        self.disconnect_btn.clicked.connect(self.disconnection_requested)
         self.disconnect_btn.hide()
         
         layout.addWidget(status_frame)
         layout.addWidget(self.connect_btn)
         layout.addWidget(self.disconnect_btn)
         
-    def _on_connect_clicked(self):
-        # Open provider selection dialog
-        dialog = ProviderSelectionDialog(self)
-        dialog.provider_connected.connect(self._on_provider_selected)
-        dialog.exec()
-        
-    def _on_provider_selected(self, email: str, provider_type: str, provider_instance):
-        """Handle provider selection from dialog"""
-        self.connection_requested.emit(provider_type)
-        
+    @pyqtSlot(object, str, str)
     def set_status(self, status: ConnectionStatus, email: str = "", provider: str = ""):
+        # Nothing to re-apply if the state didn't actually change
+        if (status, email, provider) == (self.status, self.connected_email, self.provider_type):
+            return
+            
         self.status = status
         self.connected_email = email
         self.provider_type = provider
         
-        if status == ConnectionStatus.DISCONNECTED:
-            self.status_icon.setStyleSheet(f"color: {LUMI_COLORS['accent_red']}; font-size: 16px;")
-            self.status_label.setText("Status: Not Connected")
-            self.connect_btn.show()
-            self.disconnect_btn.hide()
+        if not self._status_timer.isActive():
+            self._status_timer.start()
             
-        elif status == ConnectionStatus.CONNECTING:
-            self.status_icon.setStyleSheet(f"color: {LUMI_COLORS['accent_orange']}; font-size: 16px;")
-            self.status_label.setText("Status: Connecting...")
-            self.connect_btn.hide()
-            self.disconnect_btn.hide()
-            
-        elif status == ConnectionStatus.CONNECTED:
-            self.status_icon.setStyleSheet(f"color: {LUMI_COLORS['accent_green']}; font-size: 16px;")
-            self.status_label.setText(f"Connected to: {email}")
-            self.connect_btn.hide()
-            self.disconnect_btn.show()
-            
-        elif status == ConnectionStatus.ERROR:
-            self.status_icon.setStyleSheet(f"color: {LUMI_COLORS['accent_red']}; font-size: 16px;")
-            self.status_label.setText("Status: Connection Error")
-            self.connect_btn.show()
-            self.disconnect_btn.hide()
+    @pyqtSlot()
+    def _apply_status(self):
+        status = self.status
+        email = self.connected_email
+        
+        # Re-polish so the QLabel#statusIcon[state=...] selector is re-evaluated
+        self.status_icon.setProperty("state", int(status))
+        self.status_icon.style().unpolish(self.status_icon)
+        self.status_icon.style().polish(self.status_icon)
+        
+        template, show_connect, show_disconnect = self._STATE_TABLE[status]
+        self.status_label.setText(template.format(email=email))
+        self.connect_btn.setVisible(show_connect)
+        self.disconnect_btn.setVisible(show_disconnect)
 
 class PrimaryActionsWidget(QWidget):
     """Widget for primary backup/restore actions"""
@@ -173,180 +333,152 @@ class PrimaryActionsWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._styled = False
         self._setup_ui()
         self.set_enabled(False)  # Initially disabled
         
     def _setup_ui(self):
         layout = QHBoxLayout(self)
-        layout.setContentsMargins(20, 10, 20, 10)
-        layout.setSpacing(15)
+        _apply_layout(layout, _MARGINS_ACTIONS, 15)
         
         # Backup button
         self.backup_btn = QPushButton("🔄 Backup Settings")
         self.backup_btn.setMinimumHeight(50)
-        self.backup_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {LUMI_COLORS['accent_green']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover:enabled {{
-                background-color: {LUMI_COLORS['success']};
-            }}
-            QPushButton:disabled {{
-                background-color: {LUMI_COLORS['bg_tertiary']};
-                color: {LUMI_COLORS['text_muted']};
-            }}
-        """)
-        self.backup_btn.clicked.connect(self.backup_requested.emit)
+        self.backup_btn.clicked.connect(self.backup_requested)
         
         # Restore button
         self.restore_btn = QPushButton("📥 Restore Settings")
         self.restore_btn.setMinimumHeight(50)
-        self.restore_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {LUMI_COLORS['bg_tertiary']};
-                color: {LUMI_COLORS['text_primary']};
-                border: 2px solid {LUMI_COLORS['border']};
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover:enabled {{
-                background-color: {LUMI_COLORS['bg_hover']};
-                border-color: {LUMI_COLORS['accent_cyan']};
-            }}
-            QPushButton:disabled {{
-                background-color: {LUMI_COLORS['bg_tertiary']};
-                color: {LUMI_COLORS['text_muted']};
-                border-color: {LUMI_COLORS['border']};
-            }}
-        """)
-        self.restore_btn.clicked.connect(self.restore_requested.emit)
+        self.restore_btn.clicked.connect(self.restore_requested)
         
         layout.addWidget(self.backup_btn, 2)  # Backup button gets more space
         layout.addWidget(self.restore_btn, 1)
         
+    def showEvent(self, event):
+        # The buttons start out disabled (palette colors cover that look), so
+        # their stylesheets are only parsed once the widget is first shown
+        if not self._styled:
+            self.backup_btn.setStyleSheet(_BACKUP_BTN_QSS)
+            self.restore_btn.setStyleSheet(_RESTORE_BTN_QSS)
+            self._styled = True
+        super().showEvent(event)
+        
+    @pyqtSlot(bool)
     def set_enabled(self, enabled: bool):
         self.backup_btn.setEnabled(enabled)
         self.restore_btn.setEnabled(enabled)
 
-class BackupThread(QThread):
-    """Background thread for backup operations"""
-    
-    progress_updated = pyqtSignal(int, int, str)
-    backup_completed = pyqtSignal(dict)
-    backup_failed = pyqtSignal(str)
+@dataclass(frozen=True)
+class TransferResult:
+    """Outcome of a finished transfer, passed by reference to the UI thread"""
+    __slots__ = ('operation', 'categories', 'total_items', 'timestamp_ns')
+    operation: str
+    categories: tuple
+    total_items: int
+    timestamp_ns: int  # time.time_ns(), formatted only when displayed
+
+class TransferSignals(QObject):
+    """Signals of a TransferRunnable, which cannot emit them itself"""
     
-    def __init__(self, cloud_provider_type: str = 'google_drive', selected_categories: List[str] = None):
-        super().__init__()
-        self.cloud_provider_type = cloud_provider_type
-        self.selected_categories = selected_categories or []
-        self.is_paused = False
-        self.should_stop = False
-        
-    def run(self):
-        try:
-            # Simulate backup process
-            total_items = len(self.selected_categories) * 3  # Simulate multiple items per category
-            
-            for i, category in enumerate(self.selected_categories):
-                if self.should_stop:
-                    break
-                    
-                # Simulate processing items in category
-                for j in range(3):
-                    if self.should_stop:
-                        break
-                        
-                    while self.is_paused:
-                        self.msleep(100)
-                        if self.should_stop:
-                            break
-                    
-                    current_item = i * 3 + j + 1
-                    message = f"Backing up {category} - item {j + 1}/3"
-                    self.progress_updated.emit(current_item, total_items, message)
-                    
-                    # Simulate work
-                    self.msleep(1000)
-                    
-            if not self.should_stop:
-                self.backup_completed.emit({
-                    'categories': self.selected_categories,
-                    'total_items': total_items,
-                    'timestamp': datetime.datetime.now()
-                })
-        except Exception as e:
-            self.backup_failed.emit(str(e))
-            
-    def pause(self):
-        self.is_paused = True
-        
-    def resume(self):
-        self.is_paused = False
-        
-    def stop(self):
-        self.should_stop = True
+    completed = pyqtSignal(object)  # TransferResult
+    failed = pyqtSignal(str, str)  # operation, error
+    finished = pyqtSignal()
 
-class RestoreThread(QThread):
-    """Background thread for restore operations"""
+class TransferRunnable(QRunnable):
+    """Backup or restore operation run on the shared QThreadPool"""
     
-    progress_updated = pyqtSignal(int, int, str)
-    restore_completed = pyqtSignal(dict)
-    restore_failed = pyqtSignal(str)
+    _VERBS = {'backup': "Backing up", 'restore': "Restoring"}
     
-    def __init__(self, cloud_provider_type: str = 'google_drive', selected_categories: List[str] = None):
+    # Items are I/O bound, so several run at once on a small pool
+    MAX_WORKERS = 4
+    
+    def __init__(self, operation: str, cloud_provider_type: str = 'google_drive',
+                 selected_categories: List[str] = None):
         super().__init__()
+        # The window keeps using this object after run() returns
+        self.setAutoDelete(False)
+        self.signals = TransferSignals()
+        self.is_running = True  # until run() returns
+        self.operation = operation
         self.cloud_provider_type = cloud_provider_type
         self.selected_categories = selected_categories or []
         self.is_paused = False
         self.should_stop = False
+        self._pause_mutex = QMutex()
+        self._pause_cond = QWaitCondition()
+        # Latest (current, total, message); the UI polls it via take_progress()
+        # rather than receiving one queued signal per item
+        self._progress_mutex = QMutex()
+        self._latest_progress = None
+        
+    def _wait_if_paused(self) -> bool:
+        """Block while paused; returns False once the transfer should stop"""
+        # resume()/stop() wake us up through the wait condition
+        self._pause_mutex.lock()
+        while self.is_paused and not self.should_stop:
+            self._pause_cond.wait(self._pause_mutex)
+        self._pause_mutex.unlock()
+        return not self.should_stop
+        
+    def _transfer_item(self, category: str, item: int) -> str:
+        """Transfer a single item of a category on a pool thread"""
+        if not self._wait_if_paused():
+            return ""
+        
+        # Simulate work
+        QThread.msleep(1000)
+        return f"{self._VERBS[self.operation]} {category} - item {item + 1}/3"
         
     def run(self):
         try:
-            # Simulate restore process
-            total_items = len(self.selected_categories) * 3
+            # Simulate transfer process with multiple items per category
+            tasks = [(category, j) for category in self.selected_categories for j in range(3)]
+            total_items = len(tasks)
             
-            for i, category in enumerate(self.selected_categories):
-                if self.should_stop:
-                    break
-                    
-                for j in range(3):
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = [executor.submit(self._transfer_item, *task) for task in tasks]
+                for done, future in enumerate(as_completed(futures), 1):
                     if self.should_stop:
+                        for pending in futures:
+                            pending.cancel()
                         break
-                        
-                    while self.is_paused:
-                        self.msleep(100)
-                        if self.should_stop:
-                            break
-                    
-                    current_item = i * 3 + j + 1
-                    message = f"Restoring {category} - item {j + 1}/3"
-                    self.progress_updated.emit(current_item, total_items, message)
                     
-                    self.msleep(1000)
+                    message = future.result()
+                    self._progress_mutex.lock()
+                    self._latest_progress = (done, total_items, message)
+                    self._progress_mutex.unlock()
                     
             if not self.should_stop:
-                self.restore_completed.emit({
-                    'categories': self.selected_categories,
-                    'total_items': total_items,
-                    'timestamp': datetime.datetime.now()
-                })
+                self.signals.completed.emit(TransferResult(
+                    self.operation, tuple(self.selected_categories), total_items, time.time_ns()
+                ))
         except Exception as e:
-            self.restore_failed.emit(str(e))
+            self.signals.failed.emit(self.operation, str(e))
+        finally:
+            self.is_running = False
+            self.signals.finished.emit()
             
+    def take_progress(self):
+        """Return and clear the latest progress snapshot, or None if unchanged"""
+        self._progress_mutex.lock()
+        snapshot, self._latest_progress = self._latest_progress, None
+        self._progress_mutex.unlock()
+        return snapshot
+        
     def pause(self):
         self.is_paused = True
         
     def resume(self):
+        self._pause_mutex.lock()
         self.is_paused = False
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
         
     def stop(self):
+        self._pause_mutex.lock()
         self.should_stop = True
+        self._pause_cond.wakeAll()
+        self._pause_mutex.unlock()
 
 class RedesignedMainWindow(QMainWindow):
     """Main application window with redesigned two-column layout"""
@@ -354,12 +486,21 @@ class RedesignedMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.cloud_provider = None
-        self.backup_thread = None
-        self.restore_thread = None
+        self.transfer = None
         self.connection_status = ConnectionStatus.DISCONNECTED
+        self._provider_dialog = None
+        
+        # Drains the transfer thread's progress snapshot at ~60 fps
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._drain_progress)
+        
         self._setup_ui()
         self._connect_signals()
         
+        # Selected category IDs, refreshed only when the selection changes
+        self._cached_selection = tuple(self.selection_pane.get_selected_categories())
+        
     def _setup_ui(self):
         """Setup the user interface"""
         self.setWindowTitle("LumiSync v2.0 - Linux Settings Synchronization")
@@ -367,73 +508,43 @@ class RedesignedMainWindow(QMainWindow):
         self.resize(1400, 900)
         
         # Apply main window styling
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {LUMI_COLORS['bg_primary']};
-                color: {LUMI_COLORS['text_primary']};
-            }}
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
         
         # Central widget with splitter for two-column layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
         main_layout = QHBoxLayout(central_widget)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
+        _apply_layout(main_layout, _MARGINS_NONE, 0)
         
         # Create splitter for resizable columns
         splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background-color: {LUMI_COLORS['border']};
-                width: 2px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {LUMI_COLORS['accent_cyan']};
-            }}
-        """)
+        splitter.setStyleSheet(_SPLITTER_QSS)
         
         # Left column - Selection Pane (30% width)
         left_panel = QFrame()
-        left_panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {LUMI_COLORS['bg_secondary']};
-                border-right: 1px solid {LUMI_COLORS['border']};
-            }}
-        """)
+        left_panel.setStyleSheet(_LEFT_PANEL_QSS)
         left_panel.setMinimumWidth(350)
         left_panel.setMaximumWidth(500)
         
         left_layout = QVBoxLayout(left_panel)
-        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.setContentsMargins(_MARGINS_NONE)
         
         self.selection_pane = SelectionPaneWidget()
         left_layout.addWidget(self.selection_pane)
         
         # Right column - Action & Information Pane (70% width)
         right_panel = QFrame()
-        right_panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {LUMI_COLORS['bg_primary']};
-            }}
-        """)
+        right_panel.setStyleSheet(_RIGHT_PANEL_QSS)
         
         right_layout = QVBoxLayout(right_panel)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(0)
+        _apply_layout(right_layout, _MARGINS_NONE, 0)
         
         # Top section: Cloud connection and primary actions (always visible)
         top_section = QFrame()
-        top_section.setStyleSheet(f"""
-            QFrame {{
-                background-color: {LUMI_COLORS['bg_primary']};
-                border-bottom: 1px solid {LUMI_COLORS['border']};
-            }}
-        """)
+        top_section.setStyleSheet(_TOP_SECTION_QSS)
         top_layout = QVBoxLayout(top_section)
-        top_layout.setContentsMargins(0, 10, 0, 10)
-        top_layout.setSpacing(10)
+        _apply_layout(top_layout, _MARGINS_TOP, 10)
         
         # Cloud connection widget
         self.cloud_connection = CloudConnectionWidget()
@@ -445,36 +556,21 @@ class RedesignedMainWindow(QMainWindow):
         
         # Bottom section: Tabbed layout
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {LUMI_COLORS['border']};
-                background-color: {LUMI_COLORS['bg_primary']};
-            }}
-            QTabBar::tab {{
-                background-color: {LUMI_COLORS['bg_secondary']};
-                color: {LUMI_COLORS['text_primary']};
-                border: 1px solid {LUMI_COLORS['border']};
-                border-bottom: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {LUMI_COLORS['bg_primary']};
-                border-bottom: 2px solid {LUMI_COLORS['accent_cyan']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {LUMI_COLORS['bg_hover']};
-            }}
-        """)
+        self.tab_widget.setStyleSheet(_TAB_WIDGET_QSS)
         
         # Create tabs
         self.progress_tab = ProgressTabWidget()
         self.logs_tab = LogsTabWidget()
-        self.settings_tab = SettingsTabWidget()
+        
+        # The settings tab is built on first visit; until then its page is
+        # an empty container
+        self.settings_tab = None
+        self._settings_page = QWidget()
+        QVBoxLayout(self._settings_page).setContentsMargins(_MARGINS_NONE)
         
         self.tab_widget.addTab(self.progress_tab, "Progress")
         self.tab_widget.addTab(self.logs_tab, "Logs")
-        self.tab_widget.addTab(self.settings_tab, "Settings")
+        self.tab_widget.addTab(self._settings_page, "Settings")
         
         right_layout.addWidget(top_section)
         right_layout.addWidget(self.tab_widget, 1)  # Tab widget takes remaining space
@@ -488,13 +584,7 @@ class RedesignedMainWindow(QMainWindow):
         
         # Status bar
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {LUMI_COLORS['bg_secondary']};
-                color: {LUMI_COLORS['text_secondary']};
-                border-top: 1px solid {LUMI_COLORS['border']};
-            }}
-        """)
+        self.status_bar.setStyleSheet(_STATUS_BAR_QSS)
         self.status_bar.showMessage("Ready - Select items to synchronize and connect to cloud storage")
         self.setStatusBar(self.status_bar)
         
@@ -516,36 +606,45 @@ class RedesignedMainWindow(QMainWindow):
         self.progress_tab.resume_requested.connect(self._resume_operation)
         self.progress_tab.stop_requested.connect(self._stop_operation)
         
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        
+    def _ensure_tab(self, index: int):
+        """Build the settings tab the first time it is shown"""
+        if self.settings_tab is None and self.tab_widget.widget(index) is self._settings_page:
+            self.settings_tab = SettingsTabWidget()
+            self._settings_page.layout().addWidget(self.settings_tab)
+            
     def _on_selection_changed(self):
         """Handle selection changes"""
-        has_selection = self.selection_pane.has_selection()
+        # A category checkbox is checked (or partially checked) exactly when
+        # one of its items is, so this also answers has_selection()
+        self._cached_selection = tuple(self.selection_pane.get_selected_categories())
+        has_selection = bool(self._cached_selection)
         is_connected = self.connection_status == ConnectionStatus.CONNECTED
         
         # Enable/disable primary actions based on selection and connection
         self.primary_actions.set_enabled(has_selection and is_connected)
-        
-        if has_selection and is_connected:
-            self.status_bar.showMessage("Ready to backup or restore selected items")
-        elif has_selection:
-            self.status_bar.showMessage("Connect to cloud storage to enable backup/restore")
-        elif is_connected:
-            self.status_bar.showMessage("Select items to synchronize")
-        else:
-            self.status_bar.showMessage("Select items and connect to cloud storage")
+        self.status_bar.showMessage(_SELECTION_STATUS_MESSAGES[has_selection][is_connected])
             
-    def _connect_to_cloud(self, provider_type: str):
+    def _connect_to_cloud(self):
         """Connect to cloud storage"""
-        try:
-            self.cloud_connection.set_status(ConnectionStatus.CONNECTING)
-            
-            # Open provider selection dialog for real authentication
-            dialog = ProviderSelectionDialog(self)
-            dialog.provider_connected.connect(self._on_real_connection_success)
-            dialog.exec()
-                
-        except Exception as e:
-            logger.error(f"Cloud connection error: {str(e)}")
-            self.cloud_connection.set_status(ConnectionStatus.ERROR)
+        self.cloud_connection.set_status(ConnectionStatus.CONNECTING)
+        
+        # Open the dialog without a nested event loop; authentication runs on
+        # the dialog's AuthenticationThread, so the UI thread never blocks.
+        # The dialog is built once and reused for later connection attempts
+        if self._provider_dialog is None:
+            self._provider_dialog = ProviderSelectionDialog(self)
+            self._provider_dialog.provider_connected.connect(self._on_real_connection_success)
+            self._provider_dialog.finished.connect(self._on_provider_dialog_finished)
+        else:
+            self._provider_dialog.reset()
+        self._provider_dialog.open()
+        
+    def _on_provider_dialog_finished(self, result: int):
+        """Reset the connection status if the dialog was cancelled"""
+        if result != QDialog.DialogCode.Accepted:
+            self.cloud_connection.set_status(self.connection_status)
             
     def _on_real_connection_success(self, email: str, provider_type: str, provider_instance):
         """Handle successful real-world connection"""
@@ -570,7 +669,7 @@ class RedesignedMainWindow(QMainWindow):
         
     def _start_backup(self):
         """Start backup process"""
-        selected_categories = self.selection_pane.get_selected_categories()
+        selected_categories = list(self._cached_selection)
         if not selected_categories:
             QMessageBox.warning(self, "No Selection", "Please select items to backup.")
             return
@@ -578,18 +677,11 @@ class RedesignedMainWindow(QMainWindow):
         self.logs_tab.add_log(f"Starting backup of {len(selected_categories)} categories", "INFO")
         self.tab_widget.setCurrentIndex(0)  # Switch to Progress tab
         
-        # Start backup thread
-        self.backup_thread = BackupThread("google_drive", selected_categories)
-        self.backup_thread.progress_updated.connect(self.progress_tab.update_progress)
-        self.backup_thread.backup_completed.connect(self._on_backup_completed)
-        self.backup_thread.backup_failed.connect(self._on_backup_failed)
-        
-        self.progress_tab.start_operation(len(selected_categories) * 3)
-        self.backup_thread.start()
+        self._start_transfer("backup", selected_categories)
         
     def _start_restore(self):
         """Start restore process"""
-        selected_categories = self.selection_pane.get_selected_categories()
+        selected_categories = list(self._cached_selection)
         if not selected_categories:
             QMessageBox.warning(self, "No Selection", "Please select items to restore.")
             return
@@ -597,64 +689,101 @@ class RedesignedMainWindow(QMainWindow):
         self.logs_tab.add_log(f"Starting restore of {len(selected_categories)} categories", "INFO")
         self.tab_widget.setCurrentIndex(0)  # Switch to Progress tab
         
-        # Start restore thread
-        self.restore_thread = RestoreThread("google_drive", selected_categories)
-        self.restore_thread.progress_updated.connect(self.progress_tab.update_progress)
-        self.restore_thread.restore_completed.connect(self._on_restore_completed)
-        self.restore_thread.restore_failed.connect(self._on_restore_failed)
+        self._start_transfer("restore", selected_categories)
+        
+    def _start_transfer(self, operation: str, selected_categories: List[str]):
+        """Start a backup or restore transfer on the shared thread pool"""
+        self.transfer = TransferRunnable(operation, "google_drive", selected_categories)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.transfer.signals.completed.connect(self._on_transfer_completed, queued)
+        self.transfer.signals.failed.connect(self._on_transfer_failed, queued)
+        self.transfer.signals.finished.connect(self._on_transfer_finished, queued)
         
         self.progress_tab.start_operation(len(selected_categories) * 3)
-        self.restore_thread.start()
+        QThreadPool.globalInstance().start(self.transfer)
+        self._progress_timer.start()
+        
+    def _drain_progress(self):
+        """Push the latest transfer progress to the progress tab"""
+        if self.transfer:
+            snapshot = self.transfer.take_progress()
+            if snapshot:
+                self.progress_tab.update_progress(*snapshot)
+                
+    def _on_transfer_finished(self):
+        """Flush the final progress update and stop polling"""
+        self._progress_timer.stop()
+        self._drain_progress()
+        
+    def _active_transfer(self) -> Optional[TransferRunnable]:
+        """Return the running transfer, if any"""
+        if self.transfer and self.transfer.is_running:
+            return self.transfer
+        return None
         
     def _pause_operation(self):
         """Pause current operation"""
-        if self.backup_thread and self.backup_thread.isRunning():
-            self.backup_thread.pause()
-            self.logs_tab.add_log("Backup paused", "INFO")
-        elif self.restore_thread and self.restore_thread.isRunning():
-            self.restore_thread.pause()
-            self.logs_tab.add_log("Restore paused", "INFO")
+        thread = self._active_transfer()
+        if thread:
+            thread.pause()
+            self.logs_tab.add_log(f"{thread.operation.title()} paused", "INFO")
             
     def _resume_operation(self):
         """Resume current operation"""
-        if self.backup_thread and self.backup_thread.isRunning():
-            self.backup_thread.resume()
-            self.logs_tab.add_log("Backup resumed", "INFO")
-        elif self.restore_thread and self.restore_thread.isRunning():
-            self.restore_thread.resume()
-            self.logs_tab.add_log("Restore resumed", "INFO")
+        thread = self._active_transfer()
+        if thread:
+            thread.resume()
+            self.logs_tab.add_log(f"{thread.operation.title()} resumed", "INFO")
             
     def _stop_operation(self):
         """Stop current operation"""
-        if self.backup_thread and self.backup_thread.isRunning():
-            self.backup_thread.stop()
-            self.logs_tab.add_log("Backup stopped", "WARNING")
-        elif self.restore_thread and self.restore_thread.isRunning():
-            self.restore_thread.stop()
-            self.logs_tab.add_log("Restore stopped", "WARNING")
+        thread = self._active_transfer()
+        if thread:
+            thread.stop()
+            self.logs_tab.add_log(f"{thread.operation.title()} stopped", "WARNING")
+            
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a window-modal message box without blocking in a nested event loop"""
+        msg = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+        msg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        msg.open()
+        
+    def _on_transfer_completed(self, result: TransferResult):
+        """Route transfer completion to the operation's handler"""
+        if result.operation == "backup":
+            self._on_backup_completed(result)
+        else:
+            self._on_restore_completed(result)
+            
+    def _on_transfer_failed(self, operation: str, error: str):
+        """Route transfer failure to the operation's handler"""
+        if operation == "backup":
+            self._on_backup_failed(error)
+        else:
+            self._on_restore_failed(error)
             
-    def _on_backup_completed(self, backup_info: Dict[str, Any]):
+    def _on_backup_completed(self, result: TransferResult):
         """Handle backup completion"""
         self.logs_tab.add_log("Backup completed successfully", "INFO")
         self.progress_tab.last_backup_label.setText(
-            backup_info['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
+            datetime.datetime.fromtimestamp(result.timestamp_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S")
         )
-        QMessageBox.information(self, "Backup Complete", "Settings backup completed successfully!")
+        self._show_message(QMessageBox.Icon.Information, "Backup Complete", "Settings backup completed successfully!")
         
     def _on_backup_failed(self, error: str):
         """Handle backup failure"""
         self.logs_tab.add_log(f"Backup failed: {error}", "ERROR")
-        QMessageBox.critical(self, "Backup Failed", f"Backup failed: {error}")
+        self._show_message(QMessageBox.Icon.Critical, "Backup Failed", f"Backup failed: {error}")
         
-    def _on_restore_completed(self, restore_info: Dict[str, Any]):
+    def _on_restore_completed(self, result: TransferResult):
         """Handle restore completion"""
         self.logs_tab.add_log("Restore completed successfully", "INFO")
-        QMessageBox.information(self, "Restore Complete", "Settings restore completed successfully!")
+        self._show_message(QMessageBox.Icon.Information, "Restore Complete", "Settings restore completed successfully!")
         
     def _on_restore_failed(self, error: str):
         """Handle restore failure"""
         self.logs_tab.add_log(f"Restore failed: {error}", "ERROR")
-        QMessageBox.critical(self, "Restore Failed", f"Restore failed: {error}")
+        self._show_message(QMessageBox.Icon.Critical, "Restore Failed", f"Restore failed: {error}")
 
 def create_application():
     """Create and configure the QApplication"""
@@ -1,19 +1,43 @@
 # Theme system for LumiSync GUI
 
-from .lumi_setup_theme import LUMI_COLORS, FONTS, STYLES, create_font, apply_dark_palette, get_style, get_color, get_font_config
-from .theme_manager import ThemeManager, get_theme_manager
-from .styled_widgets import (
-    LumiButton, LumiProgressBar, LumiCheckBox, LumiLabel, LumiFrame,
-    LumiTextEdit, LumiTreeWidget, CategoryGroup, StatusPanel, LumiSplitter
-)
+import importlib
+
+from .lumi_setup_theme import LUMI_COLORS, FONTS, STYLES, get_global_stylesheet, create_font, apply_dark_palette, rebuild_styles, get_style, get_color, get_font_config
+
+# The theme manager and styled widgets pull in most of QtWidgets, so they are
+# only imported on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    'ThemeManager': '.theme_manager',
+    'get_theme_manager': '.theme_manager',
+    'LumiButton': '.styled_widgets',
+    'LumiProgressBar': '.styled_widgets',
+    'LumiCheckBox': '.styled_widgets',
+    'LumiLabel': '.styled_widgets',
+    'LumiFrame': '.styled_widgets',
+    'LumiTextEdit': '.styled_widgets',
+    'LumiTreeWidget': '.styled_widgets',
+    'CategoryGroup': '.styled_widgets',
+    'StatusPanel': '.styled_widgets',
+    'LumiSplitter': '.styled_widgets',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Lumi-Setup theme
-    'LUMI_COLORS', 'FONTS', 'STYLES', 'create_font', 'apply_dark_palette', 
-    'get_style', 'get_color', 'get_font_config',
+    'LUMI_COLORS', 'FONTS', 'STYLES', 'get_global_stylesheet', 'create_font', 'apply_dark_palette',
+    'rebuild_styles', 'get_style', 'get_color', 'get_font_config',
     # Theme manager
     'ThemeManager', 'get_theme_manager',
     # Styled widgets
     'LumiButton', 'LumiProgressBar', 'LumiCheckBox', 'LumiLabel', 'LumiFrame',
     'LumiTextEdit', 'LumiTreeWidget', 'CategoryGroup', 'StatusPanel', 'LumiSplitter'
-]
\ No newline at end of file
+]
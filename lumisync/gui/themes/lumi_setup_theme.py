@@ -3,12 +3,18 @@ Lumi-Setup Style Theme for LumiSync
 Modern dark theme with cyan accents matching the Lumi-Setup v2.0 design
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Optional
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QPalette, QColor
 
-# Color palette based on Lumi-Setup analysis
-LUMI_COLORS = {
+# Indicator and branch icons referenced by the stylesheets
+ASSETS_DIR = Path(__file__).resolve().parent.parent.parent / "assets"
+
+# Color palette based on Lumi-Setup analysis (change it through rebuild_styles)
+_LUMI_COLORS = {
     # Primary backgrounds
     'bg_primary': '#2b2b2b',        # Main dark background
     'bg_secondary': '#3a3a3a',      # Secondary panels
@@ -45,9 +51,13 @@ LUMI_COLORS = {
     'progress_bg': '#3a3a3a',       # Progress bar background
     'progress_fill': '#4a9eff',     # Progress bar fill
 }
+LUMI_COLORS = MappingProxyType(_LUMI_COLORS)
+
+# Parsed QColor for every palette entry, so palette setup needs no hex parsing
+_QCOLORS = {name: QColor(value) for name, value in LUMI_COLORS.items()}
 
 # Typography settings
-FONTS = {
+FONTS = MappingProxyType({
     'primary': {
         'family': 'Segoe UI',
         'size': 10,
@@ -73,291 +83,412 @@ FONTS = {
         'size': 9,
         'weight': QFont.Weight.Normal
     }
-}
+})
 
-# Component-specific styles
-STYLES = {
-    'main_window': f"""
-        QMainWindow {{
-            background-color: {LUMI_COLORS['bg_primary']};
-            color: {LUMI_COLORS['text_primary']};
+# Component-specific style templates; placeholders name LUMI_COLORS keys or assets_dir
+_STYLE_TEMPLATES = {
+    'main_window': """
+        QMainWindow#LumiMainWindow {{
+            background-color: {bg_primary};
+            color: {text_primary};
         }}
     """,
     
-    'sidebar': f"""
-        QWidget {{
-            background-color: {LUMI_COLORS['bg_secondary']};
-            border-right: 1px solid {LUMI_COLORS['border']};
+    'sidebar': """
+        QWidget#LumiSidebar {{
+            background-color: {bg_secondary};
+            border-right: 1px solid {border};
         }}
     """,
     
-    'header': f"""
-        QWidget {{
-            background-color: {LUMI_COLORS['bg_tertiary']};
-            border-bottom: 1px solid {LUMI_COLORS['border']};
+    'header': """
+        QWidget#LumiHeader {{
+            background-color: {bg_tertiary};
+            border-bottom: 1px solid {border};
             min-height: 60px;
         }}
     """,
     
-    'primary_button': f"""
-        QPushButton {{
-            background-color: {LUMI_COLORS['accent_cyan']};
-            color: {LUMI_COLORS['text_primary']};
+    'frame': """
+        QFrame[lumiFrameType="panel"] {{
+            background-color: {bg_secondary};
+            border: 1px solid {border};
+            border-radius: 6px;
+        }}
+        QFrame[lumiFrameType="sidebar"] {{
+            background-color: {bg_secondary};
+            border-right: 1px solid {border};
+        }}
+        QFrame[lumiFrameType="header"] {{
+            background-color: {bg_tertiary};
+            border-bottom: 1px solid {border};
+            min-height: 60px;
+        }}
+        QFrame[lumiFrameType] QLabel {{
+            background: transparent;
+        }}
+    """,
+    
+    'primary_button': """
+        QPushButton#LumiPrimaryButton {{
+            background-color: {accent_cyan};
+            color: {text_primary};
             border: none;
             border-radius: 6px;
             padding: 8px 16px;
             font-weight: bold;
             min-height: 32px;
         }}
-        QPushButton:hover {{
+        QPushButton#LumiPrimaryButton:hover {{
             background-color: #5aa3ff;
         }}
-        QPushButton:pressed {{
+        QPushButton#LumiPrimaryButton:pressed {{
             background-color: #3a8eff;
         }}
-        QPushButton:disabled {{
-            background-color: {LUMI_COLORS['bg_tertiary']};
-            color: {LUMI_COLORS['text_muted']};
+        QPushButton#LumiPrimaryButton:disabled {{
+            background-color: {bg_tertiary};
+            color: {text_muted};
         }}
     """,
     
-    'secondary_button': f"""
-        QPushButton {{
-            background-color: {LUMI_COLORS['bg_tertiary']};
-            color: {LUMI_COLORS['text_primary']};
-            border: 1px solid {LUMI_COLORS['border']};
+    'secondary_button': """
+        QPushButton#LumiSecondaryButton {{
+            background-color: {bg_tertiary};
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 6px;
             padding: 8px 16px;
             min-height: 32px;
         }}
-        QPushButton:hover {{
-            background-color: {LUMI_COLORS['bg_hover']};
-            border-color: {LUMI_COLORS['accent_cyan']};
+        QPushButton#LumiSecondaryButton:hover {{
+            background-color: {bg_hover};
+            border-color: {accent_cyan};
         }}
-        QPushButton:pressed {{
-            background-color: {LUMI_COLORS['bg_secondary']};
+        QPushButton#LumiSecondaryButton:pressed {{
+            background-color: {bg_secondary};
         }}
-        QPushButton:disabled {{
-            background-color: {LUMI_COLORS['bg_secondary']};
-            color: {LUMI_COLORS['text_muted']};
-            border-color: {LUMI_COLORS['separator']};
+        QPushButton#LumiSecondaryButton:disabled {{
+            background-color: {bg_secondary};
+            color: {text_muted};
+            border-color: {separator};
         }}
     """,
     
-    'success_button': f"""
-        QPushButton {{
-            background-color: {LUMI_COLORS['accent_green']};
-            color: {LUMI_COLORS['bg_primary']};
+    'success_button': """
+        QPushButton#LumiSuccessButton {{
+            background-color: {accent_green};
+            color: {bg_primary};
             border: none;
             border-radius: 6px;
             padding: 8px 16px;
             font-weight: bold;
             min-height: 32px;
         }}
-        QPushButton:hover {{
+        QPushButton#LumiSuccessButton:hover {{
             background-color: #00e699;
         }}
-        QPushButton:pressed {{
+        QPushButton#LumiSuccessButton:pressed {{
             background-color: #00cc77;
         }}
     """,
     
-    'danger_button': f"""
-        QPushButton {{
-            background-color: {LUMI_COLORS['accent_red']};
-            color: {LUMI_COLORS['text_primary']};
+    'danger_button': """
+        QPushButton#LumiDangerButton {{
+            background-color: {accent_red};
+            color: {text_primary};
             border: none;
             border-radius: 6px;
             padding: 8px 16px;
             font-weight: bold;
             min-height: 32px;
         }}
-        QPushButton:hover {{
+        QPushButton#LumiDangerButton:hover {{
             background-color: #ff5768;
         }}
-        QPushButton:pressed {{
+        QPushButton#LumiDangerButton:pressed {{
             background-color: #ff3746;
         }}
     """,
     
-    'progress_bar': f"""
-        QProgressBar {{
-            border: 2px solid {LUMI_COLORS['border']};
+    'progress_bar': """
+        QProgressBar#LumiProgressBar {{
+            border: 2px solid {border};
             border-radius: 8px;
-            background-color: {LUMI_COLORS['progress_bg']};
+            background-color: {progress_bg};
             text-align: center;
-            color: {LUMI_COLORS['text_primary']};
+            color: {text_primary};
             font-weight: bold;
             font-size: 11px;
             min-height: 20px;
         }}
-        QProgressBar::chunk {{
+        QProgressBar#LumiProgressBar::chunk {{
             background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {LUMI_COLORS['accent_cyan']}, stop:1 {LUMI_COLORS['accent_teal']});
+                stop:0 {accent_cyan}, stop:1 {accent_teal});
             border-radius: 6px;
             margin: 1px;
         }}
     """,
     
-    'checkbox': f"""
-        QCheckBox {{
-            color: {LUMI_COLORS['text_primary']};
+    'checkbox': """
+        QCheckBox#LumiCheckBox {{
+            color: {text_primary};
             spacing: 8px;
         }}
-        QCheckBox::indicator {{
+        QCheckBox#LumiCheckBox::indicator {{
+            width: 18px;
+            height: 18px;
+            border: 2px solid {border};
+            border-radius: 3px;
+            background-color: {bg_secondary};
+        }}
+        QCheckBox#LumiCheckBox::indicator:hover {{
+            border-color: {accent_cyan};
+        }}
+        QCheckBox#LumiCheckBox::indicator:checked {{
+            background-color: {checkbox_checked};
+            border-color: {checkbox_checked};
+            image: url("{assets_dir}/checkbox_checked.svg");
+        }}
+    """,
+    
+    'check_list': """
+        QListWidget#LumiCheckList {{
+            background-color: transparent;
+            color: {text_primary};
+            border: none;
+            outline: none;
+        }}
+        QListWidget#LumiCheckList::item {{
+            padding: 2px 0px;
+            border: none;
+        }}
+        QListWidget#LumiCheckList::indicator {{
             width: 18px;
             height: 18px;
-            border: 2px solid {LUMI_COLORS['border']};
+            border: 2px solid {border};
             border-radius: 3px;
-            background-color: {LUMI_COLORS['bg_secondary']};
+            background-color: {bg_secondary};
         }}
-        QCheckBox::indicator:hover {{
-            border-color: {LUMI_COLORS['accent_cyan']};
+        QListWidget#LumiCheckList::indicator:hover {{
+            border-color: {accent_cyan};
         }}
-        QCheckBox::indicator:checked {{
-            background-color: {LUMI_COLORS['checkbox_checked']};
-            border-color: {LUMI_COLORS['checkbox_checked']};
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDQuNUw0LjUgOEwxMSAxIiBzdHJva2U9IndoaXRlIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K);
+        QListWidget#LumiCheckList::indicator:checked {{
+            background-color: {checkbox_checked};
+            border-color: {checkbox_checked};
+            image: url("{assets_dir}/checkbox_checked.svg");
         }}
     """,
     
-    'text_edit': f"""
-        QTextEdit {{
-            background-color: {LUMI_COLORS['bg_secondary']};
-            color: {LUMI_COLORS['text_primary']};
-            border: 1px solid {LUMI_COLORS['border']};
+    'text_edit': """
+        QTextEdit#LumiTextEdit {{
+            background-color: {bg_secondary};
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 4px;
             padding: 8px;
-            selection-background-color: {LUMI_COLORS['selection']};
+            selection-background-color: {selection};
         }}
-        QTextEdit:focus {{
-            border-color: {LUMI_COLORS['accent_cyan']};
+        QTextEdit#LumiTextEdit:focus {{
+            border-color: {accent_cyan};
         }}
     """,
     
-    'tab_widget': f"""
-        QTabWidget::pane {{
-            border: 1px solid {LUMI_COLORS['border']};
-            background-color: {LUMI_COLORS['bg_secondary']};
-        }}
-        QTabBar::tab {{
-            background-color: {LUMI_COLORS['bg_tertiary']};
-            color: {LUMI_COLORS['text_secondary']};
+    'tab_widget': """
+        QTabWidget#LumiTabWidget::pane {{
+            border: 1px solid {border};
+            background-color: {bg_secondary};
+        }}
+        QTabWidget#LumiTabWidget QTabBar::tab {{
+            background-color: {bg_tertiary};
+            color: {text_secondary};
             padding: 8px 16px;
             margin-right: 2px;
             border-top-left-radius: 4px;
             border-top-right-radius: 4px;
         }}
-        QTabBar::tab:selected {{
-            background-color: {LUMI_COLORS['accent_cyan']};
-            color: {LUMI_COLORS['text_primary']};
+        QTabWidget#LumiTabWidget QTabBar::tab:selected {{
+            background-color: {accent_cyan};
+            color: {text_primary};
         }}
-        QTabBar::tab:hover:!selected {{
-            background-color: {LUMI_COLORS['bg_hover']};
-            color: {LUMI_COLORS['text_primary']};
+        QTabWidget#LumiTabWidget QTabBar::tab:hover:!selected {{
+            background-color: {bg_hover};
+            color: {text_primary};
         }}
     """,
     
-    'tree_widget': f"""
-        QTreeWidget {{
-            background-color: {LUMI_COLORS['bg_secondary']};
-            color: {LUMI_COLORS['text_primary']};
+    'tree_widget': """
+        QTreeWidget#LumiTreeWidget {{
+            background-color: {bg_secondary};
+            color: {text_primary};
             border: none;
-            selection-background-color: {LUMI_COLORS['selection']};
+            selection-background-color: {selection};
             outline: none;
         }}
-        QTreeWidget::item {{
+        QTreeWidget#LumiTreeWidget::item {{
             padding: 4px;
             border: none;
         }}
-        QTreeWidget::item:hover {{
-            background-color: {LUMI_COLORS['bg_hover']};
+        QTreeWidget#LumiTreeWidget::item:hover {{
+            background-color: {bg_hover};
         }}
-        QTreeWidget::item:selected {{
-            background-color: {LUMI_COLORS['selection']};
+        QTreeWidget#LumiTreeWidget::item:selected {{
+            background-color: {selection};
         }}
-        QTreeWidget::branch:has-children:!has-siblings:closed,
-        QTreeWidget::branch:closed:has-children:has-siblings {{
+        QTreeWidget#LumiTreeWidget::branch:has-children:!has-siblings:closed,
+        QTreeWidget#LumiTreeWidget::branch:closed:has-children:has-siblings {{
             border-image: none;
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iOCIgaGVpZ2h0PSI4IiB2aWV3Qm94PSIwIDAgOCA4IiBmaWxsPSJub25lIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciPgo8cGF0aCBkPSJNMiAxTDYgNEwyIDciIHN0cm9rZT0iIzRhOWVmZiIgc3Ryb2tlLXdpZHRoPSIxLjUiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K);
+            image: url("{assets_dir}/tree_branch_closed.svg");
         }}
-        QTreeWidget::branch:open:has-children:!has-siblings,
-        QTreeWidget::branch:open:has-children:has-siblings {{
+        QTreeWidget#LumiTreeWidget::branch:open:has-children:!has-siblings,
+        QTreeWidget#LumiTreeWidget::branch:open:has-children:has-siblings {{
             border-image: none;
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iOCIgaGVpZ2h0PSI4IiB2aWV3Qm94PSIwIDAgOCA4IiBmaWxsPSJub25lIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciPgo8cGF0aCBkPSJNMSAyTDQgNkw3IDIiIHN0cm9rZT0iIzRhOWVmZiIgc3Ryb2tlLXdpZHRoPSIxLjUiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K);
+            image: url("{assets_dir}/tree_branch_open.svg");
         }}
     """,
     
-    'status_bar': f"""
-        QStatusBar {{
-            background-color: {LUMI_COLORS['bg_tertiary']};
-            color: {LUMI_COLORS['text_secondary']};
-            border-top: 1px solid {LUMI_COLORS['border']};
+    'status_bar': """
+        QStatusBar#LumiStatusBar {{
+            background-color: {bg_tertiary};
+            color: {text_secondary};
+            border-top: 1px solid {border};
         }}
     """,
     
-    'group_box': f"""
-        QGroupBox {{
-            color: {LUMI_COLORS['text_primary']};
-            border: 1px solid {LUMI_COLORS['border']};
+    'group_box': """
+        QGroupBox#LumiGroupBox {{
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 4px;
             margin-top: 8px;
             font-weight: bold;
         }}
-        QGroupBox::title {{
+        QGroupBox#LumiGroupBox::title {{
             subcontrol-origin: margin;
             left: 8px;
             padding: 0 4px 0 4px;
-            background-color: {LUMI_COLORS['bg_primary']};
+            background-color: {bg_primary};
         }}
     """
 }
 
+def _resolve_style_templates() -> Dict[str, str]:
+    """Fill the style templates with the current colors and the assets path."""
+    values = dict(LUMI_COLORS, assets_dir=ASSETS_DIR.as_posix())
+    return {name: template.format_map(values) for name, template in _STYLE_TEMPLATES.items()}
+
+# Component-specific styles
+STYLES = _resolve_style_templates()
+
+# Object names the STYLES rules are scoped to; widgets opt in by name
+# (the 'frame' rules select on the lumiFrameType property instead)
+STYLE_OBJECT_NAMES = {
+    'main_window': 'LumiMainWindow',
+    'sidebar': 'LumiSidebar',
+    'header': 'LumiHeader',
+    'primary_button': 'LumiPrimaryButton',
+    'secondary_button': 'LumiSecondaryButton',
+    'success_button': 'LumiSuccessButton',
+    'danger_button': 'LumiDangerButton',
+    'progress_bar': 'LumiProgressBar',
+    'checkbox': 'LumiCheckBox',
+    'check_list': 'LumiCheckList',
+    'text_edit': 'LumiTextEdit',
+    'tab_widget': 'LumiTabWidget',
+    'tree_widget': 'LumiTreeWidget',
+    'status_bar': 'LumiStatusBar',
+    'group_box': 'LumiGroupBox',
+}
+
+# All component rules in one sheet, parsed once by QApplication; rebound by
+# rebuild_styles, so read it through get_global_stylesheet()
+_GLOBAL_STYLESHEET = "\n".join(STYLES.values())
+
+def get_global_stylesheet() -> str:
+    """Get all component rules as one stylesheet, for the current palette."""
+    return _GLOBAL_STYLESHEET
+
+def rebuild_styles(new_colors: Dict[str, str]) -> None:
+    """Update palette colors and re-resolve STYLES and the global stylesheet from the templates.
+    
+    Only call this before the GUI modules are imported: the main window and
+    styled widgets render some colors into module and class constants at
+    import time, and those keep the old palette.
+    """
+    global _GLOBAL_STYLESHEET
+    _LUMI_COLORS.update(new_colors)
+    _QCOLORS.update((name, QColor(value)) for name, value in new_colors.items())
+    STYLES.update(_resolve_style_templates())
+    _GLOBAL_STYLESHEET = "\n".join(STYLES.values())
+
+@lru_cache(maxsize=16)
+def _cached_font(family: str, size: int, weight: QFont.Weight) -> QFont:
+    """Build a QFont once per (family, size, weight)."""
+    font = QFont(family, size)
+    font.setWeight(weight)
+    return font
+
 def create_font(font_config: Dict[str, Any]) -> QFont:
     """Create a QFont from configuration."""
-    font = QFont(font_config['family'], font_config['size'])
-    font.setWeight(font_config['weight'])
-    return font
+    # Copy of the cached font, so callers may still modify what they get back
+    return QFont(_cached_font(font_config['family'], font_config['size'], font_config['weight']))
 
-def apply_dark_palette(app) -> None:
-    """Apply dark color palette to the application."""
-    palette = QPalette()
-    
+# Palette roles and the LUMI_COLORS key each is filled from
+_PALETTE_ROLES = (
     # Window colors
-    palette.setColor(QPalette.ColorRole.Window, QColor(LUMI_COLORS['bg_primary']))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(LUMI_COLORS['text_primary']))
-    
+    (QPalette.ColorRole.Window, 'bg_primary'),
+    (QPalette.ColorRole.WindowText, 'text_primary'),
     # Base colors (for input widgets)
-    palette.setColor(QPalette.ColorRole.Base, QColor(LUMI_COLORS['bg_secondary']))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(LUMI_COLORS['bg_tertiary']))
-    
+    (QPalette.ColorRole.Base, 'bg_secondary'),
+    (QPalette.ColorRole.AlternateBase, 'bg_tertiary'),
     # Text colors
-    palette.setColor(QPalette.ColorRole.Text, QColor(LUMI_COLORS['text_primary']))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(LUMI_COLORS['text_primary']))
-    
+    (QPalette.ColorRole.Text, 'text_primary'),
+    (QPalette.ColorRole.BrightText, 'text_primary'),
     # Button colors
-    palette.setColor(QPalette.ColorRole.Button, QColor(LUMI_COLORS['bg_tertiary']))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(LUMI_COLORS['text_primary']))
-    
+    (QPalette.ColorRole.Button, 'bg_tertiary'),
+    (QPalette.ColorRole.ButtonText, 'text_primary'),
     # Highlight colors
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(LUMI_COLORS['accent_cyan']))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(LUMI_COLORS['text_primary']))
+    (QPalette.ColorRole.Highlight, 'accent_cyan'),
+    (QPalette.ColorRole.HighlightedText, 'text_primary'),
+)
+
+_DISABLED_PALETTE_ROLES = (
+    (QPalette.ColorRole.WindowText, 'text_muted'),
+    (QPalette.ColorRole.Text, 'text_muted'),
+    (QPalette.ColorRole.ButtonText, 'text_muted'),
+)
+
+def apply_dark_palette(app, stylesheet: Optional[str] = None) -> None:
+    """Apply dark color palette and the global component stylesheet to the application.
+    
+    Args:
+        app: The QApplication to theme
+        stylesheet: Application stylesheet to install instead of the global one
+    """
+    palette = QPalette()
+    
+    for role, color_name in _PALETTE_ROLES:
+        palette.setColor(role, _QCOLORS[color_name])
     
-    # Disabled colors
-    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, QColor(LUMI_COLORS['text_muted']))
-    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(LUMI_COLORS['text_muted']))
-    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(LUMI_COLORS['text_muted']))
+    for role, color_name in _DISABLED_PALETTE_ROLES:
+        palette.setColor(QPalette.ColorGroup.Disabled, role, _QCOLORS[color_name])
     
     app.setPalette(palette)
+    app.setStyleSheet(_GLOBAL_STYLESHEET if stylesheet is None else stylesheet)
+
+# The lookups below bind their tables as default arguments, which makes them
+# locals instead of module global lookups on every call
 
-def get_style(component: str) -> str:
+def get_style(component: str, _styles=STYLES) -> str:
     """Get stylesheet for a specific component."""
-    return STYLES.get(component, "")
+    style = _styles.get(component)
+    return style if style is not None else ""
 
-def get_color(color_name: str) -> str:
+def get_color(color_name: str, _colors=LUMI_COLORS) -> str:
     """Get color value by name."""
-    return LUMI_COLORS.get(color_name, "#ffffff")
+    color = _colors.get(color_name)
+    return color if color is not None else "#ffffff"
 
-def get_font_config(font_name: str) -> Dict[str, Any]:
+def get_font_config(font_name: str, _fonts=FONTS, _default=FONTS['primary']) -> Dict[str, Any]:
     """Get font configuration by name."""
-    return FONTS.get(font_name, FONTS['primary'])
+    config = _fonts.get(font_name)
+    return config if config is not None else _default
@@ -3,18 +3,23 @@ Styled Widgets for Lumi-Setup Theme
 Pre-configured widgets with Lumi-Setup styling applied
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from PyQt6.QtWidgets import (
     QPushButton, QProgressBar, QCheckBox, QLabel, QFrame,
     QVBoxLayout, QHBoxLayout, QWidget, QTextEdit, QTreeWidget,
-    QTreeWidgetItem, QGroupBox, QSplitter
+    QGroupBox, QSplitter, QListWidget, QListWidgetItem, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect
-from PyQt6.QtGui import QFont, QPainter, QColor, QLinearGradient
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 
 from .theme_manager import get_theme_manager
 from .lumi_setup_theme import LUMI_COLORS, create_font, FONTS
 
+# Stylesheets built per (class, variant), shared by every instance
+_CSS_CACHE: Dict[Tuple[str, str], str] = {}
+
+# One QFont per FONTS entry; QFont is implicitly shared, so widgets reuse its data
+_SHARED_FONTS = {name: create_font(config) for name, config in FONTS.items()}
+
 class LumiButton(QPushButton):
     """Styled button matching Lumi-Setup design."""
     
@@ -57,9 +62,30 @@ class LumiCheckBox(QCheckBox):
         theme_manager = get_theme_manager()
         theme_manager.style_checkbox(self)
 
+# LUMI_COLORS key used for each label type
+_LABEL_COLORS = {
+    "primary": 'text_primary',
+    "secondary": 'text_secondary',
+    "muted": 'text_muted',
+    "accent": 'text_accent',
+    "success": 'success',
+    "warning": 'warning',
+    "error": 'error'
+}
+
 class LumiLabel(QLabel):
     """Styled label with theme-appropriate colors."""
     
+    # Stylesheet per label type, built once; other types use the primary text color
+    _CSS_BY_TYPE = {
+        label_type: f"color: {LUMI_COLORS[color_name]};"
+        for label_type, color_name in _LABEL_COLORS.items()
+    }
+    _DEFAULT_CSS = _CSS_BY_TYPE["primary"]
+    
+    # Label types that also use their own font
+    _FONT_TYPES = frozenset(("header", "title"))
+    
     def __init__(self, text: str = "", label_type: str = "primary", parent: Optional[QWidget] = None):
         super().__init__(text, parent)
         self.label_type = label_type
@@ -67,29 +93,11 @@ class LumiLabel(QLabel):
     
     def _setup_style(self):
         """Setup label styling based on type."""
-        color_map = {
-            "primary": LUMI_COLORS['text_primary'],
-            "secondary": LUMI_COLORS['text_secondary'],
-            "muted": LUMI_COLORS['text_muted'],
-            "accent": LUMI_COLORS['text_accent'],
-            "success": LUMI_COLORS['success'],
-            "warning": LUMI_COLORS['warning'],
-            "error": LUMI_COLORS['error']
-        }
-        
-        font_map = {
-            "primary": "primary",
-            "header": "header",
-            "title": "title"
-        }
-        
-        color = color_map.get(self.label_type, LUMI_COLORS['text_primary'])
-        self.setStyleSheet(f"color: {color};")
+        self.setStyleSheet(self._CSS_BY_TYPE.get(self.label_type, self._DEFAULT_CSS))
         
         # Set appropriate font
-        if self.label_type in ["header", "title"]:
-            font = create_font(FONTS[self.label_type])
-            self.setFont(font)
+        if self.label_type in self._FONT_TYPES:
+            self.setFont(_SHARED_FONTS[self.label_type])
 
 class LumiFrame(QFrame):
     """Styled frame for grouping elements."""
@@ -101,29 +109,11 @@ class LumiFrame(QFrame):
     
     def _setup_style(self):
         """Setup frame styling."""
-        if self.frame_type == "panel":
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {LUMI_COLORS['bg_secondary']};
-                    border: 1px solid {LUMI_COLORS['border']};
-                    border-radius: 6px;
-                }}
-            """)
-        elif self.frame_type == "sidebar":
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {LUMI_COLORS['bg_secondary']};
-                    border-right: 1px solid {LUMI_COLORS['border']};
-                }}
-            """)
-        elif self.frame_type == "header":
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {LUMI_COLORS['bg_tertiary']};
-                    border-bottom: 1px solid {LUMI_COLORS['border']};
-                    min-height: 60px;
-                }}
-            """)
+        # Matched by the QFrame[lumiFrameType=...] rules of the application stylesheet
+        self.setProperty("lumiFrameType", self.frame_type)
+        if self.isVisible():
+            self.style().unpolish(self)
+            self.style().polish(self)
 
 class LumiTextEdit(QTextEdit):
     """Styled text edit for logs and output."""
@@ -150,15 +140,18 @@ class LumiTreeWidget(QTreeWidget):
         theme_manager.style_tree_widget(self)
 
 class CategoryGroup(QWidget):
-    """Widget representing a category group with checkboxes."""
+    """Widget representing a category group with checkable items."""
     
     category_changed = pyqtSignal(str, bool)  # category_name, checked
+    category_bulk_changed = pyqtSignal(list, bool)  # item names, checked
     
     def __init__(self, title: str, items: List[str], parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.title = title
         self.items = items
-        self.checkboxes = {}
+        # Checked state per item position, kept in sync with the list items
+        self._checked = bytearray(len(items))
+        self._positions = {item: index for index, item in enumerate(items)}
         self.is_expanded = True
         self._setup_ui()
     
@@ -200,12 +193,27 @@ class CategoryGroup(QWidget):
         items_layout.setContentsMargins(20, 4, 4, 4)
         items_layout.setSpacing(4)
         
-        # Create checkboxes for items
+        # Items are checkable rows of one list rather than a QCheckBox each
+        self.list_widget = QListWidget()
+        get_theme_manager().style_widget(self.list_widget, "check_list")
+        self.list_widget.setFont(create_font(FONTS['primary']))
+        self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        
         for item in self.items:
-            checkbox = LumiCheckBox(item)
-            checkbox.stateChanged.connect(lambda state, name=item: self._on_item_changed(name, state))
-            self.checkboxes[item] = checkbox
-            items_layout.addWidget(checkbox)
+            list_item = QListWidgetItem(item)
+            list_item.setFlags(list_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            list_item.setCheckState(Qt.CheckState.Unchecked)
+            self.list_widget.addItem(list_item)
+        
+        # Show every row; the surrounding view does the scrolling
+        if self.items:
+            rows_height = self.list_widget.sizeHintForRow(0) * len(self.items)
+            self.list_widget.setFixedHeight(rows_height + 2 * self.list_widget.frameWidth())
+        
+        self.list_widget.itemChanged.connect(self._on_item_changed)
+        items_layout.addWidget(self.list_widget)
         
         layout.addWidget(self.items_container)
         
@@ -218,30 +226,60 @@ class CategoryGroup(QWidget):
         self.expand_indicator.setText("▼" if self.is_expanded else "▶")
         self.items_container.setVisible(self.is_expanded)
     
-    def _on_item_changed(self, item_name: str, state: int):
-        """Handle item checkbox state change."""
-        is_checked = state == Qt.CheckState.Checked.value
-        self.category_changed.emit(item_name, is_checked)
+    def _on_item_changed(self, list_item: QListWidgetItem):
+        """Handle a user toggling an item."""
+        index = self.list_widget.row(list_item)
+        checked = list_item.checkState() == Qt.CheckState.Checked
+        if self._checked[index] != checked:
+            self._checked[index] = checked
+            self.category_changed.emit(self.items[index], checked)
     
     def set_item_checked(self, item_name: str, checked: bool):
         """Set the checked state of an item."""
-        if item_name in self.checkboxes:
-            self.checkboxes[item_name].setChecked(checked)
+        index = self._positions.get(item_name)
+        if index is not None:
+            self._checked[index] = checked
+            with QSignalBlocker(self.list_widget):
+                self.list_widget.item(index).setCheckState(
+                    Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+                )
     
     def get_checked_items(self) -> List[str]:
         """Get list of checked items."""
-        return [name for name, checkbox in self.checkboxes.items() if checkbox.isChecked()]
+        return [self.items[index] for index, checked in enumerate(self._checked) if checked]
     
     def set_all_checked(self, checked: bool):
         """Set all items to checked or unchecked."""
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(checked)
+        self._checked[:] = bytes([checked]) * len(self.items)
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        with QSignalBlocker(self.list_widget):
+            for index in range(self.list_widget.count()):
+                self.list_widget.item(index).setCheckState(state)
+        self.category_bulk_changed.emit(list(self.items), checked)
 
 class StatusPanel(QWidget):
     """Status panel showing current operation and statistics."""
     
+    _COMPLETED_FMT = "Completed: %d"
+    _FAILED_FMT = "Failed: %d"
+    _REMAINING_FMT = "Remaining: %d"
+    _TIME_FMT = "Time: %s"
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        # Last (completed, failed, remaining, elapsed_time) shown, to skip unchanged labels
+        self._last_statistics = (0, 0, 0, "00:00")
+        # Application name currently shown; "" while none is being processed
+        self._last_app = ""
+        
+        # Overall progress is pushed to the widgets at most every 16 ms
+        self._pending_percentage: Optional[int] = None
+        self._pending_message: Optional[str] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -310,27 +348,49 @@ class StatusPanel(QWidget):
     def update_progress(self, current: int, total: int, message: str = ""):
         """Update the overall progress."""
         if total > 0:
-            percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
+            self._pending_percentage = int((current / total) * 100)
         
         if message:
-            self.status_label.setText(message)
+            self._pending_message = message
+        
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the latest overall progress queued by update_progress."""
+        if self._pending_percentage is not None:
+            self.progress_bar.setValue(self._pending_percentage)
+            self._pending_percentage = None
+        
+        if self._pending_message is not None:
+            self.status_label.setText(self._pending_message)
+            self._pending_message = None
     
     def update_current_app(self, app_name: str, progress: int = 0):
         """Update the current application being processed."""
-        if app_name:
-            self.current_app_label.setText(f"Installing: {app_name}")
-            self.current_progress.setValue(progress)
-        else:
-            self.current_app_label.setText("No application currently being processed")
-            self.current_progress.setValue(0)
+        app_name = app_name or ""
+        if app_name != self._last_app:
+            if app_name:
+                self.current_app_label.setText(f"Installing: {app_name}")
+            else:
+                self.current_app_label.setText("No application currently being processed")
+            self._last_app = app_name
+        
+        # QProgressBar.setValue already ignores an unchanged value
+        self.current_progress.setValue(progress if app_name else 0)
     
     def update_statistics(self, completed: int, failed: int, remaining: int, elapsed_time: str = "00:00"):
         """Update the statistics display."""
-        self.completed_label.setText(f"Completed: {completed}")
-        self.failed_label.setText(f"Failed: {failed}")
-        self.remaining_label.setText(f"Remaining: {remaining}")
-        self.time_label.setText(f"Time: {elapsed_time}")
+        last_completed, last_failed, last_remaining, last_time = self._last_statistics
+        if completed != last_completed:
+            self.completed_label.setText(self._COMPLETED_FMT % completed)
+        if failed != last_failed:
+            self.failed_label.setText(self._FAILED_FMT % failed)
+        if remaining != last_remaining:
+            self.remaining_label.setText(self._REMAINING_FMT % remaining)
+        if elapsed_time != last_time:
+            self.time_label.setText(self._TIME_FMT % elapsed_time)
+        self._last_statistics = (completed, failed, remaining, elapsed_time)
 
 class LumiSplitter(QSplitter):
     """Styled splitter for dividing panels."""
@@ -341,7 +401,9 @@ class LumiSplitter(QSplitter):
     
     def _setup_style(self):
         """Setup splitter styling."""
-        self.setStyleSheet(f"""
+        css = _CSS_CACHE.get(("LumiSplitter", ""))
+        if css is None:
+            css = _CSS_CACHE[("LumiSplitter", "")] = f"""
             QSplitter::handle {{
                 background-color: {LUMI_COLORS['border']};
             }}
@@ -354,7 +416,8 @@ class LumiSplitter(QSplitter):
             QSplitter::handle:hover {{
                 background-color: {LUMI_COLORS['accent_cyan']};
             }}
-        """)
+        """
+        self.setStyleSheet(css)
         
         # Set handle width
         self.setHandleWidth(2)
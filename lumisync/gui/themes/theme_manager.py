@@ -3,16 +3,23 @@ Theme Manager for LumiSync
 Manages theme application and component styling
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from PyQt6.QtWidgets import QApplication, QWidget, QPushButton, QProgressBar, QCheckBox, QTextEdit, QTabWidget, QTreeWidget, QStatusBar, QGroupBox
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from .lumi_setup_theme import (
-    LUMI_COLORS, FONTS, STYLES, 
-    create_font, apply_dark_palette, get_style, get_color, get_font_config
+    LUMI_COLORS, FONTS, STYLES, STYLE_OBJECT_NAMES,
+    create_font, apply_dark_palette, get_color, get_font_config,
+    get_global_stylesheet
 )
 
+@lru_cache(maxsize=16)
+def _font(name: str) -> QFont:
+    """Shared QFont for a FONTS entry, for handing to setFont (which copies it)."""
+    return create_font(FONTS[name])
+
 class ThemeManager(QObject):
     """Manages theme application and updates for the application."""
     
@@ -22,23 +29,30 @@ class ThemeManager(QObject):
         super().__init__()
         self.current_theme = "lumi_setup"
         self.custom_styles = {}
+        # Full application stylesheet and the component rules it was built from
+        self._app_stylesheet = ""
+        self._app_stylesheet_source: Optional[str] = None
     
     def apply_theme_to_app(self, app: QApplication) -> None:
         """Apply the complete theme to the application."""
-        # Apply dark palette
-        apply_dark_palette(app)
-        
-        # Set application-wide stylesheet
-        app.setStyleSheet(self._get_global_stylesheet())
+        # Apply dark palette and the application-wide stylesheet in one go
+        apply_dark_palette(app, self._get_app_stylesheet())
         
         # Set default font
-        default_font = create_font(FONTS['primary'])
-        app.setFont(default_font)
+        app.setFont(_font('primary'))
+    
+    def _set_style_name(self, widget: QWidget, style_name: str) -> None:
+        """Select a STYLES rule for a widget via its object name."""
+        widget.setObjectName(STYLE_OBJECT_NAMES[style_name])
+        if widget.isVisible():
+            # Re-match the application stylesheet against the new name
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
     
     def style_widget(self, widget: QWidget, style_name: str) -> None:
         """Apply a specific style to a widget."""
-        if style_name in STYLES:
-            widget.setStyleSheet(STYLES[style_name])
+        if style_name in STYLE_OBJECT_NAMES:
+            self._set_style_name(widget, style_name)
     
     def style_button(self, button: QPushButton, button_type: str = "primary") -> None:
         """Style a button with the specified type."""
@@ -50,45 +64,41 @@ class ThemeManager(QObject):
         }
         
         style_name = style_map.get(button_type, "primary_button")
-        button.setStyleSheet(get_style(style_name))
+        self._set_style_name(button, style_name)
         
         # Set font
-        font = create_font(FONTS['button'])
-        button.setFont(font)
+        button.setFont(_font('button'))
     
     def style_progress_bar(self, progress_bar: QProgressBar) -> None:
         """Style a progress bar."""
-        progress_bar.setStyleSheet(get_style("progress_bar"))
+        self._set_style_name(progress_bar, "progress_bar")
     
     def style_checkbox(self, checkbox: QCheckBox) -> None:
         """Style a checkbox."""
-        checkbox.setStyleSheet(get_style("checkbox"))
-        font = create_font(FONTS['primary'])
-        checkbox.setFont(font)
+        self._set_style_name(checkbox, "checkbox")
+        checkbox.setFont(_font('primary'))
     
     def style_text_edit(self, text_edit: QTextEdit) -> None:
         """Style a text edit widget."""
-        text_edit.setStyleSheet(get_style("text_edit"))
-        font = create_font(FONTS['monospace'])
-        text_edit.setFont(font)
+        self._set_style_name(text_edit, "text_edit")
+        text_edit.setFont(_font('monospace'))
     
     def style_tab_widget(self, tab_widget: QTabWidget) -> None:
         """Style a tab widget."""
-        tab_widget.setStyleSheet(get_style("tab_widget"))
+        self._set_style_name(tab_widget, "tab_widget")
     
     def style_tree_widget(self, tree_widget: QTreeWidget) -> None:
         """Style a tree widget."""
-        tree_widget.setStyleSheet(get_style("tree_widget"))
+        self._set_style_name(tree_widget, "tree_widget")
     
     def style_status_bar(self, status_bar: QStatusBar) -> None:
         """Style a status bar."""
-        status_bar.setStyleSheet(get_style("status_bar"))
+        self._set_style_name(status_bar, "status_bar")
     
     def style_group_box(self, group_box: QGroupBox) -> None:
         """Style a group box."""
-        group_box.setStyleSheet(get_style("group_box"))
-        font = create_font(FONTS['header'])
-        group_box.setFont(font)
+        self._set_style_name(group_box, "group_box")
+        group_box.setFont(_font('header'))
     
     def create_styled_button(self, text: str, button_type: str = "primary", parent: Optional[QWidget] = None) -> QPushButton:
         """Create a pre-styled button."""
@@ -126,54 +136,71 @@ class ThemeManager(QObject):
         if style_name in self.custom_styles:
             widget.setStyleSheet(self.custom_styles[style_name])
     
+    def _get_app_stylesheet(self) -> str:
+        """Get the component rules plus the global rules, rebuilt only after rebuild_styles."""
+        component_rules = get_global_stylesheet()
+        if component_rules is not self._app_stylesheet_source:
+            self._app_stylesheet = component_rules + self._get_global_stylesheet()
+            self._app_stylesheet_source = component_rules
+        return self._app_stylesheet
+    
     def _get_global_stylesheet(self) -> str:
         """Get the global application stylesheet."""
+        accent_cyan = get_color('accent_cyan')
+        bg_hover = get_color('bg_hover')
+        bg_primary = get_color('bg_primary')
+        bg_secondary = get_color('bg_secondary')
+        bg_tertiary = get_color('bg_tertiary')
+        border = get_color('border')
+        separator = get_color('separator')
+        text_primary = get_color('text_primary')
+        
         return f"""
         /* Global application styles */
         QWidget {{
-            background-color: {get_color('bg_primary')};
-            color: {get_color('text_primary')};
+            background-color: {bg_primary};
+            color: {text_primary};
         }}
         
         /* Tooltips */
         QToolTip {{
-            background-color: {get_color('bg_tertiary')};
-            color: {get_color('text_primary')};
-            border: 1px solid {get_color('border')};
+            background-color: {bg_tertiary};
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 4px;
             padding: 4px;
         }}
         
         /* Scrollbars */
         QScrollBar:vertical {{
-            background-color: {get_color('bg_secondary')};
+            background-color: {bg_secondary};
             width: 12px;
             border-radius: 6px;
         }}
         QScrollBar::handle:vertical {{
-            background-color: {get_color('bg_tertiary')};
+            background-color: {bg_tertiary};
             border-radius: 6px;
             min-height: 20px;
         }}
         QScrollBar::handle:vertical:hover {{
-            background-color: {get_color('bg_hover')};
+            background-color: {bg_hover};
         }}
         QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
             height: 0px;
         }}
         
         QScrollBar:horizontal {{
-            background-color: {get_color('bg_secondary')};
+            background-color: {bg_secondary};
             height: 12px;
             border-radius: 6px;
         }}
         QScrollBar::handle:horizontal {{
-            background-color: {get_color('bg_tertiary')};
+            background-color: {bg_tertiary};
             border-radius: 6px;
             min-width: 20px;
         }}
         QScrollBar::handle:horizontal:hover {{
-            background-color: {get_color('bg_hover')};
+            background-color: {bg_hover};
         }}
         QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
             width: 0px;
@@ -181,26 +208,26 @@ class ThemeManager(QObject):
         
         /* Menu styling */
         QMenu {{
-            background-color: {get_color('bg_secondary')};
-            color: {get_color('text_primary')};
-            border: 1px solid {get_color('border')};
+            background-color: {bg_secondary};
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 4px;
         }}
         QMenu::item {{
             padding: 8px 16px;
         }}
         QMenu::item:selected {{
-            background-color: {get_color('accent_cyan')};
+            background-color: {accent_cyan};
         }}
         QMenu::separator {{
             height: 1px;
-            background-color: {get_color('separator')};
+            background-color: {separator};
             margin: 4px 0px;
         }}
         
         /* Splitter styling */
         QSplitter::handle {{
-            background-color: {get_color('border')};
+            background-color: {border};
         }}
         QSplitter::handle:horizontal {{
             width: 2px;
@@ -209,7 +236,7 @@ class ThemeManager(QObject):
             height: 2px;
         }}
         QSplitter::handle:hover {{
-            background-color: {get_color('accent_cyan')};
+            background-color: {accent_cyan};
         }}
         """
 
@@ -5,11 +5,6 @@ Launches the GUI application for Linux settings synchronization
 
 import sys
 import logging
-from pathlib import Path
-
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from lumisync.gui.main_window import MainWindow, create_application
 from lumisync.utils.logger import setup_logging, get_logger
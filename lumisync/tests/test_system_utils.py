@@ -0,0 +1,30 @@
+"""
+Tests for the GVariant text parser in system_utils
+Covers the values gsettings prints for the backed-up keys
+"""
+
+import pytest
+
+from lumisync.utils.system_utils import _parse_gvariant
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("(true, false)", (True, False)),
+    ("(uint32 1, true)", (1, True)),
+    ("('a', nothing)", ('a', None)),
+    ("[('xkb', 'us'), ('xkb', 'de')]", [('xkb', 'us'), ('xkb', 'de')]),
+    ("('a, b', 'c')", ('a, b', 'c')),
+    ("['<Super>a, b', 'it\\'s, here']", ['<Super>a, b', "it's, here"]),
+    ("@a(ss) []", []),
+    ("@as []", []),
+    ("uint32 300", 300),
+    ("1.5", 1.5),
+])
+def test_parse_gvariant(text, expected):
+    assert _parse_gvariant(text) == expected
+
+
+@pytest.mark.parametrize("text", ["{'a': <1>}", "(true, false", "'a' 'b'"])
+def test_parse_gvariant_rejects_unsupported_text(text):
+    with pytest.raises(ValueError):
+        _parse_gvariant(text)
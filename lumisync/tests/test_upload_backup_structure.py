@@ -0,0 +1,129 @@
+"""
+Tests for CloudProvider.upload_backup_structure
+Drives the concurrent upload path against an in-memory provider
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from lumisync.core.cloud_providers.base_provider import CloudProvider, UploadError
+
+
+class StubProvider(CloudProvider):
+    """Provider that records uploads instead of talking to a service"""
+
+    max_concurrent_uploads = 4
+
+    def __init__(self, fail_on: Optional[str] = None):
+        super().__init__("Stub")
+        self.fail_on = fail_on
+        self.failed = threading.Event()
+        self.uploads = []
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def upload_file(self, local_path: Path, remote_path: str,
+                   parent_id: Optional[str] = None,
+                   progress_callback: Optional[callable] = None) -> str:
+        with self._lock:
+            self.uploads.append((remote_path, parent_id))
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            if remote_path == self.fail_on:
+                self.failed.set()
+                raise IOError("connection reset")
+            if self.fail_on:
+                # Stay in flight until the failing upload has been raised
+                self.failed.wait(timeout=5)
+            time.sleep(0.05)
+            return f"id-{remote_path}"
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def authenticate(self, credentials_path: Optional[Path] = None, **kwargs) -> bool:
+        return True
+
+    def is_connected(self) -> bool:
+        return True
+
+    def get_user_info(self) -> Dict[str, Any]:
+        return {}
+
+    def create_folder(self, folder_path: str, parent_id: Optional[str] = None) -> str:
+        return "folder-id"
+
+    def download_file(self, file_id: str, local_path: Path,
+                     progress_callback: Optional[callable] = None) -> bool:
+        return False
+
+    def list_files(self, folder_id: Optional[str] = None,
+                  folder_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        return []
+
+    def delete_file(self, file_id: str) -> bool:
+        return False
+
+    def find_folder(self, folder_name: str, parent_id: Optional[str] = None) -> Optional[str]:
+        return "folder-id"
+
+    def get_storage_info(self) -> Dict[str, int]:
+        return {}
+
+
+def _backup_data(count: int) -> Dict[str, Path]:
+    return {f"file{i}.json": Path(f"/tmp/file{i}.json") for i in range(count)}
+
+
+def test_concurrent_upload_returns_every_file_id():
+    provider = StubProvider()
+
+    uploaded = provider.upload_backup_structure(_backup_data(8))
+
+    assert uploaded == {f"file{i}.json": f"id-file{i}.json" for i in range(8)}
+    assert all(parent_id == "folder-id" for _, parent_id in provider.uploads)
+    assert 1 < provider.max_active <= provider.max_concurrent_uploads
+
+
+def test_failed_upload_cancels_pending_uploads():
+    provider = StubProvider(fail_on="file0.json")
+
+    with pytest.raises(UploadError, match="file0.json"):
+        provider.upload_backup_structure(_backup_data(20))
+
+    assert len(provider.uploads) < 20
+
+
+def test_pcloud_uploads_into_parent_folder(monkeypatch, tmp_path):
+    pcloud = pytest.importorskip("lumisync.core.cloud_providers.pcloud")
+    provider = pcloud.PCloudProvider()
+    provider.is_authenticated = True
+    provider.lumisync_folder_id = 42
+    folder_ids = []
+
+    class Response:
+        status_code = 200
+
+        def json(self):
+            return {'result': 0, 'metadata': [{'fileid': 7}]}
+
+    def post(url, data, files):
+        folder_ids.append(data['folderid'])
+        return Response()
+
+    monkeypatch.setattr(pcloud.requests, "post", post)
+    backup_data = {}
+    for i in range(2):
+        backup_data[f"file{i}.json"] = tmp_path / f"file{i}.json"
+        backup_data[f"file{i}.json"].write_text("{}")
+
+    uploaded = provider.upload_backup_structure(backup_data)
+
+    assert uploaded == {"file0.json": "7", "file1.json": "7"}
+    assert folder_ids == [42, 42]
@@ -5,9 +5,17 @@ Centralized logging setup for LumiSync
 
 import logging
 import logging.config
+import logging.handlers
+import atexit
+import copy
+import queue
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import os
 import sys
+import threading
+from collections import deque
 
 from ..config.settings import LOGGING_CONFIG, LOG_FILE
 
@@ -25,38 +33,52 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once
+        self._colored = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
     def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[record.levelname]}{record.levelname}"
-                f"{self.COLORS['RESET']}"
-            )
-        
-        return super().format(record)
+        # Color the levelname for this handler only; the record is shared
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
-def setup_logging(log_level: str = 'INFO', console_output: bool = True) -> logging.Logger:
-    """
-    Set up logging configuration for LumiSync.
-    
-    Args:
-        log_level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
-        console_output: Whether to output logs to console
-        
-    Returns:
-        Configured logger instance
-    """
-    # Ensure log directory exists
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Create a copy of the logging config
-    config = LOGGING_CONFIG.copy()
+# Background thread that runs the real handlers, see setup_logging
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener():
+    """Flush queued records and stop the logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _build_config(log_level: str, console_output: bool) -> dict:
+    """Build a dictConfig dictionary from LOGGING_CONFIG without modifying it."""
+    # Deep copy: the handler dicts are changed below, and dictConfig
+    # pops keys such as '()' from the dictionaries it is given
+    config = copy.deepcopy(LOGGING_CONFIG)
     
     # Update file handler path
     config['handlers']['file']['filename'] = str(LOG_FILE)
     config['handlers']['file']['level'] = log_level
     
+    # Drop records below log_level at the logger, before they are queued
+    config['loggers']['lumisync']['level'] = log_level
+    
     # Configure console handler
     if console_output:
         config['handlers']['console']['level'] = log_level
@@ -71,16 +93,50 @@ def setup_logging(log_level: str = 'INFO', console_output: bool = True) -> loggi
         config['handlers'].pop('console', None)
         config['loggers']['lumisync']['handlers'] = ['file']
     
+    return config
+
+
+def setup_logging(log_level: str = 'INFO', console_output: bool = True) -> logging.Logger:
+    """
+    Set up logging configuration for LumiSync.
+    
+    Args:
+        log_level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+        console_output: Whether to output logs to console
+        
+    Returns:
+        Configured logger instance
+    """
+    # Ensure log directory exists
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    
     # Apply configuration
-    logging.config.dictConfig(config)
+    _stop_queue_listener()
+    logging.config.dictConfig(_build_config(log_level, console_output))
     
     # Get the main logger
     logger = logging.getLogger('lumisync')
+    
+    # Hand records to a queue so file and console I/O run on a background thread
+    global _queue_listener
+    log_queue = queue.Queue(-1)
+    handlers = list(logger.handlers)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # QueueHandler formats each record on the calling thread, so do not
+    # accept records that every real handler would discard anyway
+    queue_handler.setLevel(min(handler.level for handler in handlers))
+    logger.addHandler(queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    
     logger.info(f"Logging initialized - Level: {log_level}, Console: {console_output}")
     
     return logger
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -98,27 +154,31 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+class _CaptureHandler(logging.Handler):
+    """Handler that appends formatted records to a shared buffer."""
+    
+    def __init__(self, buffer: deque, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.buffer = buffer
+    
+    def emit(self, record):
+        self.buffer.append(self.format(record))
+
+
 class LogCapture:
     """Context manager to capture log messages for testing or display."""
     
-    def __init__(self, logger_name: str = 'lumisync', level: int = logging.INFO):
+    def __init__(self, logger_name: str = 'lumisync', level: int = logging.INFO,
+                 maxlen: Optional[int] = None):
         self.logger_name = logger_name
         self.level = level
         self.handler = None
-        self.messages = []
+        # Only the newest maxlen messages are kept when maxlen is given
+        self.messages = deque(maxlen=maxlen)
     
     def __enter__(self):
-        # Create a custom handler that captures messages
-        self.handler = logging.Handler()
-        self.handler.setLevel(self.level)
-        
-        # Custom emit method to capture messages
-        def capture_emit(record):
-            self.messages.append(self.handler.format(record))
-        
-        self.handler.emit = capture_emit
-        
-        # Add handler to logger
+        # Add a handler that captures messages to the logger
+        self.handler = _CaptureHandler(self.messages, self.level)
         logger = logging.getLogger(self.logger_name)
         logger.addHandler(self.handler)
         
@@ -131,34 +191,40 @@ class LogCapture:
     
     def get_messages(self) -> list:
         """Get captured log messages."""
-        return self.messages.copy()
+        return list(self.messages)
     
     def clear(self):
         """Clear captured messages."""
         self.messages.clear()
 
 
+def _format_call_args(args: tuple, kwargs: dict) -> str:
+    """Format call arguments the way they would appear in source."""
+    args_str = ', '.join([str(arg) for arg in args])
+    kwargs_str = ', '.join([f"{k}={v}" for k, v in kwargs.items()])
+    return ', '.join(filter(None, [args_str, kwargs_str]))
+
+
 def log_function_call(func):
     """
     Decorator to log function calls with arguments and return values.
     Useful for debugging.
     """
+    logger = get_logger(func.__module__)
+    
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        
-        # Log function entry
-        args_str = ', '.join([str(arg) for arg in args])
-        kwargs_str = ', '.join([f"{k}={v}" for k, v in kwargs.items()])
-        all_args = ', '.join(filter(None, [args_str, kwargs_str]))
-        
-        logger.debug(f"Calling {func.__name__}({all_args})")
+        # Only format arguments and results when debug output is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Calling %s(%s)", func.__name__, _format_call_args(args, kwargs))
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} returned: {result}")
+            if debug:
+                logger.debug("%s returned: %s", func.__name__, result)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} raised {type(e).__name__}: {e}")
+            logger.error("%s raised %s: %s", func.__name__, type(e).__name__, e)
             raise
     
     return wrapper
@@ -170,18 +236,18 @@ def log_performance(func):
     """
     import time
     
+    logger = get_logger(func.__module__)
+    
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.info(f"{func.__name__} completed in {execution_time:.2f}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s completed in %.2fs", func.__name__, time.perf_counter() - start_time)
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"{func.__name__} failed after {execution_time:.2f}s: {e}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("%s failed after %.2fs: %s", func.__name__, time.perf_counter() - start_time, e)
             raise
     
     return wrapper
@@ -226,43 +292,51 @@ class ProgressLogger:
         self.total_steps = total_steps
         self.current_step = 0
         self.logger = get_logger('lumisync.progress')
+        self._info = self.logger.info
+        self._percent_per_step = 100.0 / total_steps if total_steps else 0.0
         
-        self.logger.info(f"Starting {operation_name} ({total_steps} steps)")
+        self._info("Starting %s (%d steps)", operation_name, total_steps)
     
     def step(self, message: str = ""):
         """Advance to the next step."""
         self.current_step += 1
-        percentage = (self.current_step / self.total_steps) * 100
+        percentage = self.current_step * self._percent_per_step
         
-        progress_msg = f"{self.operation_name}: Step {self.current_step}/{self.total_steps} ({percentage:.1f}%)"
         if message:
-            progress_msg += f" - {message}"
-        
-        self.logger.info(progress_msg)
+            self._info("%s: Step %d/%d (%.1f%%) - %s", self.operation_name,
+                       self.current_step, self.total_steps, percentage, message)
+        else:
+            self._info("%s: Step %d/%d (%.1f%%)", self.operation_name,
+                       self.current_step, self.total_steps, percentage)
     
     def complete(self, message: str = ""):
         """Mark the operation as complete."""
-        complete_msg = f"{self.operation_name} completed"
         if message:
-            complete_msg += f" - {message}"
-        
-        self.logger.info(complete_msg)
+            self._info("%s completed - %s", self.operation_name, message)
+        else:
+            self._info("%s completed", self.operation_name)
     
     def error(self, message: str):
         """Log an error during the operation."""
-        self.logger.error(f"{self.operation_name} failed at step {self.current_step}: {message}")
+        self.logger.error("%s failed at step %d: %s", self.operation_name, self.current_step, message)
 
 
 # Initialize logging when module is imported
 _logger_initialized = False
+_init_lock = threading.Lock()
 
 def ensure_logging_initialized():
     """Ensure logging is initialized (called automatically)."""
     global _logger_initialized
-    if not _logger_initialized:
+    if _logger_initialized:
+        return
+    with _init_lock:
+        if _logger_initialized:
+            return
         setup_logging()
         setup_exception_logging()
         _logger_initialized = True
 
-# Auto-initialize logging
-ensure_logging_initialized()
+# Auto-initialize logging, unless the caller sets it up itself later
+if not os.environ.get('LUMISYNC_NO_AUTO_LOG'):
+    ensure_logging_initialized()
@@ -4,22 +4,140 @@ Handles desktop settings backup and restoration
 """
 
 import subprocess
+import ast
+import configparser
 import json
 import os
+import re
+import shutil
+import socket
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from ..config.settings import GNOME_SETTINGS_KEYS
 
 logger = logging.getLogger(__name__)
 
+# Environment for subprocesses whose output is parsed: untranslated messages
+_C_LOCALE_ENV = {**os.environ, 'LC_ALL': 'C'}
+
+# PRETTY_NAME line of /etc/os-release, with optional quotes
+_OS_RELEASE_RE = re.compile(rb'^PRETTY_NAME="?([^"\n]+?)"?$', re.M)
+
 
 class SystemUtilsError(Exception):
     """Base exception for system utilities operations"""
     pass
 
 
+# One token of the GVariant text format, as printed by gsettings
+_GVARIANT_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<hex>[-+]?0[xX][0-9a-fA-F]+)
+      | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<word>@[\w()]+|[A-Za-z_]\w*)
+      | (?P<punct>[\[\](),])
+    )""", re.X)
+
+_GVARIANT_CONSTANTS = {'true': True, 'false': False, 'nothing': None}
+
+# Type annotations that may prefix a value, e.g. "uint32 5" or "@as []"
+_GVARIANT_TYPE_WORDS = frozenset({
+    'boolean', 'byte', 'int16', 'uint16', 'int32', 'uint32', 'int64',
+    'uint64', 'handle', 'double', 'string', 'objectpath', 'signature'
+})
+
+
+def _parse_gvariant(text: str) -> Any:
+    """
+    Parse GVariant text of booleans, numbers, strings, arrays and tuples.
+    
+    Raises:
+        ValueError: If the text is not of that form
+    """
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _GVARIANT_TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Unexpected GVariant text at {pos}: {text!r}")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        pos = match.end()
+    
+    def parse_value(i: int) -> Tuple[Any, int]:
+        if i >= len(tokens):
+            raise ValueError(f"Incomplete GVariant text: {text!r}")
+        kind, token = tokens[i]
+        if kind == 'string':
+            return ast.literal_eval(token), i + 1
+        if kind == 'hex':
+            return int(token, 16), i + 1
+        if kind == 'number':
+            return (int(token) if token.lstrip('+-').isdigit() else float(token)), i + 1
+        if kind == 'word':
+            if token in _GVARIANT_CONSTANTS:
+                return _GVARIANT_CONSTANTS[token], i + 1
+            if token.startswith('@') or token in _GVARIANT_TYPE_WORDS:
+                return parse_value(i + 1)
+            raise ValueError(f"Unknown GVariant word {token!r}")
+        if token in '[(':
+            closing = ']' if token == '[' else ')'
+            items = []
+            i += 1
+            while i < len(tokens) and tokens[i][1] != closing:
+                item, i = parse_value(i)
+                items.append(item)
+                if i < len(tokens) and tokens[i][1] == ',':
+                    i += 1
+            if i >= len(tokens):
+                raise ValueError(f"Unclosed GVariant container: {text!r}")
+            return (items if token == '[' else tuple(items)), i + 1
+        raise ValueError(f"Unexpected GVariant token {token!r}")
+    
+    value, end = parse_value(0)
+    if end != len(tokens):
+        raise ValueError(f"Trailing GVariant text: {text!r}")
+    return value
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> Dict[str, str]:
+    """Collect system information once per process; it does not change while running."""
+    info = {}
+    
+    try:
+        # Get hostname
+        info['hostname'] = socket.gethostname()
+    except Exception:
+        info['hostname'] = 'unknown'
+    
+    try:
+        # Get OS information
+        match = _OS_RELEASE_RE.search(Path('/etc/os-release').read_bytes())
+        info['os'] = match.group(1).decode() if match else 'Linux'
+    except Exception:
+        info['os'] = 'Linux'
+    
+    # Get the desktop from the session before asking gnome-shell for its version
+    desktop = os.environ.get('XDG_CURRENT_DESKTOP')
+    if desktop:
+        info['desktop'] = desktop
+    else:
+        try:
+            result = subprocess.run(['gnome-shell', '--version'], capture_output=True, text=True)
+            if result.returncode == 0:
+                info['desktop'] = result.stdout.strip()
+        except Exception:
+            info['desktop'] = 'GNOME'
+    
+    return info
+
+
 class GnomeSettingsManager:
     """
     Manager for GNOME desktop settings using gsettings and dconf.
@@ -28,29 +146,35 @@ class GnomeSettingsManager:
     wallpapers, dock settings, and other GNOME configuration.
     """
     
+    # Concurrent gsettings processes used for single-key reads
+    max_workers = 8
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # (schema, key) of each setting key, split once
+        self._key_parts: Dict[str, Tuple[str, str]] = {
+            key: tuple(key.rsplit('.', 1)) for key in GNOME_SETTINGS_KEYS
+        }
+        # Schemas of the backed up keys, each read with a single gsettings call
+        self._schemas = list(dict.fromkeys(schema for schema, _ in self._key_parts.values()))
         self._validate_environment()
     
     def _validate_environment(self):
         """Validate that we're running in a GNOME environment."""
         try:
             # Check if gsettings is available
-            result = subprocess.run(['which', 'gsettings'], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
+            if shutil.which('gsettings') is None:
                 raise SystemUtilsError("gsettings command not found. GNOME environment required.")
             
             # Check if we can access the GNOME settings
             result = subprocess.run(['gsettings', 'list-schemas'], 
-                                  capture_output=True, text=True)
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                  stdin=subprocess.DEVNULL, env=_C_LOCALE_ENV, timeout=5)
             if result.returncode != 0:
                 raise SystemUtilsError("Cannot access GNOME settings. Check DISPLAY variable.")
             
             self.logger.info("GNOME environment validated successfully")
             
-        except FileNotFoundError:
-            raise SystemUtilsError("gsettings command not found. Please install GNOME.")
         except Exception as e:
             raise SystemUtilsError(f"Failed to validate GNOME environment: {e}")
     
@@ -71,10 +195,21 @@ class GnomeSettingsManager:
         
         self.logger.info("Starting GNOME settings backup")
         
+        # Read all keys of each schema at once
+        values = {}
+        for schema in self._schemas:
+            values.update(self._bulk_read_schema(schema))
+        
+        # Fall back to concurrent single-key reads for anything not listed
+        missing = [key for key in GNOME_SETTINGS_KEYS if key not in values]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                values.update(zip(missing, executor.map(self._get_setting, missing)))
+        
         # Backup individual settings keys
         for key in GNOME_SETTINGS_KEYS:
             try:
-                value = self._get_setting(key)
+                value = values[key]
                 if value is not None:
                     settings_backup['settings'][key] = value
                     self.logger.debug(f"Backed up setting: {key} = {value}")
@@ -120,8 +255,21 @@ class GnomeSettingsManager:
             success_count = 0
             total_count = 0
             
-            # Restore individual settings
             settings = settings_backup.get('settings', {})
+            keybindings = settings_backup.get('custom_keybindings', [])
+            
+            # Write everything in one dconf transaction when possible; values
+            # whose type only the schema knows are left to gsettings below
+            batch = {key: value for key, value in settings.items() if self._has_explicit_type(value)}
+            keyfile = self._emit_dconf_keyfile({**batch, **self._keybinding_settings(keybindings)})
+            if self._load_dconf_keyfile(keyfile):
+                success_count = total_count = len(batch)
+                settings = {key: value for key, value in settings.items() if key not in batch}
+                if keybindings:
+                    self.logger.info(f"Restored {len(keybindings)} custom keybindings")
+                keybindings = []
+            
+            # Restore individual settings
             for key, value in settings.items():
                 total_count += 1
                 try:
@@ -134,7 +282,6 @@ class GnomeSettingsManager:
                     self.logger.warning(f"Error restoring setting {key}: {e}")
             
             # Restore custom keybindings
-            keybindings = settings_backup.get('custom_keybindings', [])
             if keybindings:
                 try:
                     self._restore_custom_keybindings(keybindings)
@@ -155,15 +302,19 @@ class GnomeSettingsManager:
             self.logger.error(f"Settings restoration failed: {e}")
             return False
     
+    def _split_key(self, key: str) -> Tuple[str, str]:
+        """Split a setting key into schema and key name."""
+        parts = self._key_parts.get(key)
+        if parts is None:
+            parts = tuple(key.rsplit('.', 1))
+            if len(parts) != 2:
+                raise ValueError(f"Invalid setting key format: {key}")
+        return parts
+    
     def _get_setting(self, key: str) -> Optional[Any]:
         """Get a single GNOME setting value."""
         try:
-            # Split schema and key
-            parts = key.rsplit('.', 1)
-            if len(parts) != 2:
-                raise ValueError(f"Invalid setting key format: {key}")
-            
-            schema, setting_key = parts
+            schema, setting_key = self._split_key(key)
             
             result = subprocess.run(
                 ['gsettings', 'get', schema, setting_key],
@@ -185,22 +336,43 @@ class GnomeSettingsManager:
             self.logger.warning(f"Error getting setting {key}: {e}")
             return None
     
+    def _bulk_read_schema(self, schema: str) -> Dict[str, Any]:
+        """Get all values of a schema, keyed by full setting key."""
+        values = {}
+        try:
+            result = subprocess.run(
+                ['gsettings', 'list-recursively', schema],
+                capture_output=True, text=True, timeout=10
+            )
+            
+            if result.returncode != 0:
+                self.logger.debug(f"Failed to list schema {schema}: {result.stderr}")
+                return values
+            
+            # Each line is "<schema> <key> <value>"
+            for line in result.stdout.splitlines():
+                parts = line.split(' ', 2)
+                if len(parts) == 3:
+                    values[f"{parts[0]}.{parts[1]}"] = self._parse_gsettings_value(parts[2])
+                    
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Timeout listing schema: {schema}")
+        except Exception as e:
+            self.logger.warning(f"Error listing schema {schema}: {e}")
+        
+        return values
+    
     def _set_setting(self, key: str, value: Any) -> bool:
         """Set a single GNOME setting value."""
         try:
-            # Split schema and key
-            parts = key.rsplit('.', 1)
-            if len(parts) != 2:
-                raise ValueError(f"Invalid setting key format: {key}")
-            
-            schema, setting_key = parts
+            schema, setting_key = self._split_key(key)
             
             # Format value for gsettings
             formatted_value = self._format_gsettings_value(value)
             
             result = subprocess.run(
                 ['gsettings', 'set', schema, setting_key, formatted_value],
-                capture_output=True, text=True, timeout=10
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=10
             )
             
             if result.returncode == 0:
@@ -219,57 +391,31 @@ class GnomeSettingsManager:
     def _parse_gsettings_value(self, value: str) -> Any:
         """Parse a gsettings value string to appropriate Python type."""
         value = value.strip()
-        
-        # Handle different value types
-        if value == 'true':
-            return True
-        elif value == 'false':
-            return False
-        elif value.startswith("'") and value.endswith("'"):
-            # String value
-            return value[1:-1]
-        elif value.startswith('[') and value.endswith(']'):
-            # Array value
-            try:
-                # Remove brackets and split by comma
-                inner = value[1:-1].strip()
-                if not inner:
-                    return []
-                
-                items = []
-                for item in inner.split(','):
-                    item = item.strip()
-                    if item.startswith("'") and item.endswith("'"):
-                        items.append(item[1:-1])
-                    else:
-                        items.append(item)
-                return items
-            except Exception:
-                return value
-        else:
-            # Try to parse as number
-            try:
-                if '.' in value:
-                    return float(value)
-                else:
-                    return int(value)
-            except ValueError:
-                return value
+        try:
+            return _parse_gvariant(value)
+        except ValueError:
+            # Keep values we cannot parse (dictionaries, variants) verbatim
+            return value
     
     def _format_gsettings_value(self, value: Any) -> str:
         """Format a Python value for gsettings."""
         if isinstance(value, bool):
             return 'true' if value else 'false'
         elif isinstance(value, str):
-            return f"'{value}'"
+            escaped = value.replace('\\', '\\\\').replace("'", "\\'")
+            return f"'{escaped}'"
+        elif isinstance(value, tuple):
+            formatted_items = [self._format_gsettings_value(item) for item in value]
+            if len(formatted_items) == 1:
+                return f"({formatted_items[0]},)"
+            return f"({', '.join(formatted_items)})"
         elif isinstance(value, list):
-            # Format array
-            formatted_items = []
-            for item in value:
-                if isinstance(item, str):
-                    formatted_items.append(f"'{item}'")
-                else:
-                    formatted_items.append(str(item))
+            # Nested arrays of backed up keys are tuples, e.g. input sources
+            # a(ss), which JSON stores as lists
+            formatted_items = [
+                self._format_gsettings_value(tuple(item) if isinstance(item, list) else item)
+                for item in value
+            ]
             return f"[{', '.join(formatted_items)}]"
         else:
             return str(value)
@@ -292,14 +438,23 @@ class GnomeSettingsManager:
                     # Extract paths from the array format
                     paths = self._parse_gsettings_value(paths_str)
                     
+                    # Details of all keybindings from a single dconf dump
+                    keybindings_dir = '/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/'
+                    details = self._dump_dconf_dir(keybindings_dir)
+                    
                     for path in paths:
-                        if isinstance(path, str) and path.startswith('/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/'):
+                        if isinstance(path, str) and path.startswith(keybindings_dir):
                             # Get keybinding details
-                            schema = f"org.gnome.settings-daemon.plugins.media-keys.custom-keybinding:{path}"
-                            
-                            name = self._get_setting(f"{schema}.name")
-                            command = self._get_setting(f"{schema}.command")
-                            binding = self._get_setting(f"{schema}.binding")
+                            section = details.get(path[len(keybindings_dir):].strip('/'))
+                            if section is not None:
+                                name = section.get('name')
+                                command = section.get('command')
+                                binding = section.get('binding')
+                            else:
+                                schema = f"org.gnome.settings-daemon.plugins.media-keys.custom-keybinding:{path}"
+                                name = self._get_setting(f"{schema}.name")
+                                command = self._get_setting(f"{schema}.command")
+                                binding = self._get_setting(f"{schema}.binding")
                             
                             if name and command and binding:
                                 keybindings.append({
@@ -314,30 +469,132 @@ class GnomeSettingsManager:
         
         return keybindings
     
+    def _dump_dconf_dir(self, directory: str) -> Dict[str, Dict[str, Any]]:
+        """Get all values below a dconf directory, keyed by relative section path."""
+        sections = {}
+        try:
+            result = subprocess.run(
+                ['dconf', 'dump', directory],
+                capture_output=True, text=True, timeout=10
+            )
+            
+            if result.returncode != 0:
+                self.logger.debug(f"Failed to dump {directory}: {result.stderr}")
+                return sections
+            
+            parser = configparser.ConfigParser(interpolation=None, strict=False)
+            parser.optionxform = str
+            parser.read_string(result.stdout)
+            for section in parser.sections():
+                sections[section] = {
+                    key: self._parse_gsettings_value(value)
+                    for key, value in parser.items(section)
+                }
+                
+        except FileNotFoundError:
+            self.logger.debug("dconf not found, reading values one by one")
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Timeout dumping {directory}")
+        except Exception as e:
+            self.logger.warning(f"Error dumping {directory}: {e}")
+        
+        return sections
+    
+    def _keybinding_settings(self, keybindings: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Get the setting keys and values that define custom keybindings."""
+        settings = {}
+        if not keybindings:
+            return settings
+        
+        # Create new paths for keybindings
+        paths = []
+        for i, keybinding in enumerate(keybindings):
+            path = f"/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/custom{i}/"
+            paths.append(path)
+            
+            # Keybinding details
+            schema = f"org.gnome.settings-daemon.plugins.media-keys.custom-keybinding:{path}"
+            settings[f"{schema}.name"] = keybinding['name']
+            settings[f"{schema}.command"] = keybinding['command']
+            settings[f"{schema}.binding"] = keybinding['binding']
+        
+        # The paths array goes last so every listed path is complete
+        settings['org.gnome.settings-daemon.plugins.media-keys.custom-keybindings'] = paths
+        return settings
+    
     def _restore_custom_keybindings(self, keybindings: List[Dict[str, str]]):
         """Restore custom keybindings."""
         if not keybindings:
             return
         
         try:
-            # Create new paths for keybindings
-            paths = []
-            for i, keybinding in enumerate(keybindings):
-                path = f"/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings/custom{i}/"
-                paths.append(path)
-                
-                # Set keybinding details
-                schema = f"org.gnome.settings-daemon.plugins.media-keys.custom-keybinding:{path}"
-                self._set_setting(f"{schema}.name", keybinding['name'])
-                self._set_setting(f"{schema}.command", keybinding['command'])
-                self._set_setting(f"{schema}.binding", keybinding['binding'])
-            
-            # Set the paths array
-            self._set_setting('org.gnome.settings-daemon.plugins.media-keys.custom-keybindings', paths)
+            for key, value in self._keybinding_settings(keybindings).items():
+                self._set_setting(key, value)
             
         except Exception as e:
             self.logger.warning(f"Error restoring custom keybindings: {e}")
     
+    def _dconf_path(self, schema: str) -> str:
+        """Get the dconf directory of a schema, e.g. org/gnome/desktop/interface."""
+        if ':' in schema:
+            # Relocatable schema with an explicit path
+            return schema.split(':', 1)[1].strip('/')
+        return schema.replace('.', '/')
+    
+    def _has_explicit_type(self, value: Any) -> bool:
+        """
+        Check whether the formatted value alone determines its GVariant type.
+        
+        dconf stores values without consulting the schema, so numbers (which
+        may be uint32 or double keys) and empty arrays (e.g. an empty a(ss)
+        input-sources list) must be set through gsettings instead.
+        """
+        if isinstance(value, (bool, str)):
+            return True
+        if isinstance(value, list):
+            return bool(value) and all(self._has_explicit_type(item) for item in value)
+        if isinstance(value, tuple):
+            return all(self._has_explicit_type(item) for item in value)
+        return False
+    
+    def _emit_dconf_keyfile(self, settings: Dict[str, Any]) -> str:
+        """Format settings as a keyfile for `dconf load /`."""
+        sections: Dict[str, List[str]] = {}
+        for key, value in settings.items():
+            schema, setting_key = key.rsplit('.', 1)
+            formatted_value = self._format_gsettings_value(value)
+            sections.setdefault(self._dconf_path(schema), []).append(f"{setting_key}={formatted_value}")
+        
+        return ''.join(
+            f"[{path}]\n" + ''.join(f"{line}\n" for line in lines) + "\n"
+            for path, lines in sections.items()
+        )
+    
+    def _load_dconf_keyfile(self, keyfile: str) -> bool:
+        """Write a keyfile into the dconf database in one call."""
+        if not keyfile:
+            return False
+        
+        try:
+            result = subprocess.run(
+                ['dconf', 'load', '/'],
+                input=keyfile, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                text=True, timeout=30
+            )
+            
+            if result.returncode == 0:
+                return True
+            self.logger.warning(f"dconf load failed, restoring settings one by one: {result.stderr}")
+            
+        except FileNotFoundError:
+            self.logger.debug("dconf not found, restoring settings one by one")
+        except subprocess.TimeoutExpired:
+            self.logger.warning("Timeout loading settings with dconf")
+        except Exception as e:
+            self.logger.warning(f"Error loading settings with dconf: {e}")
+        
+        return False
+    
     def _backup_extensions(self) -> Dict[str, Any]:
         """Backup GNOME Shell extensions settings."""
         extensions = {}
@@ -375,36 +632,7 @@ class GnomeSettingsManager:
     
     def get_system_info(self) -> Dict[str, str]:
         """Get system information for backup metadata."""
-        info = {}
-        
-        try:
-            # Get hostname
-            result = subprocess.run(['hostname'], capture_output=True, text=True)
-            if result.returncode == 0:
-                info['hostname'] = result.stdout.strip()
-        except Exception:
-            info['hostname'] = 'unknown'
-        
-        try:
-            # Get OS information
-            if Path('/etc/os-release').exists():
-                with open('/etc/os-release', 'r') as f:
-                    for line in f:
-                        if line.startswith('PRETTY_NAME='):
-                            info['os'] = line.split('=', 1)[1].strip().strip('"')
-                            break
-        except Exception:
-            info['os'] = 'Linux'
-        
-        try:
-            # Get GNOME version
-            result = subprocess.run(['gnome-shell', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                info['desktop'] = result.stdout.strip()
-        except Exception:
-            info['desktop'] = 'GNOME'
-        
-        return info
+        return dict(_system_info())
 
 
 # Convenience functions
@@ -15,7 +15,8 @@ def read_readme():
 # Read requirements
 def read_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        lines = map(str.strip, fh.read().splitlines())
+        return [line for line in lines if line and line[0] != "#"]
 
 setup(
     name="lumisync",
@@ -26,7 +27,8 @@ setup(
     long_description=read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/lumisync/lumisync",
-    packages=find_packages(),
+    # Only search below lumisync/, not venv/, build/ or .git/ in the checkout
+    packages=["lumisync"] + [f"lumisync.{package}" for package in find_packages("lumisync")],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: End Users/Desktop",
@@ -48,14 +50,8 @@ setup(
             "lumisync=lumisync.main:main",
         ],
     },
+    # Data files are listed in MANIFEST.in
     include_package_data=True,
-    package_data={
-        "lumisync": [
-            "assets/*",
-            "config/*.json",
-            "gui/themes/*.qss",
-        ],
-    },
     keywords="linux desktop synchronization settings backup restore",
     project_urls={
         "Bug Reports": "https://github.com/lumisync/lumisync/issues",